@@ -0,0 +1,219 @@
+import argparse
+import asyncio
+import json
+import os
+import time
+from datetime import datetime
+from itertools import cycle
+
+import online
+from launch_profiles import resolve_launch_profile
+from playwright.async_api import async_playwright
+from results_sink import ResultsSink
+
+
+# ===============================
+# BATCH CONFIGURATION
+# ===============================
+
+BATCH_CONFIG = {
+    "browsers": 2,               # shared browser processes
+    "max_sites": 4,              # sites running at the same time
+    "max_per_host": 2,           # concurrent cases per host, across all its sites
+    "politeness_delay_ms": 500,  # minimum gap between case starts on one host
+    "launch_profile": "ci",
+
+    # Applied to every site; a site config overrides them
+    "site_defaults": {
+        "workers": 2,
+        "har": {"mode": None}
+    }
+}
+
+# Keys of a discover.py JSON config that are not online.py CONFIG keys
+DISCOVERY_ONLY_KEYS = ("offline", "notes")
+
+
+# ===============================
+# SITE CONFIGS
+# ===============================
+
+def load_sites(paths):
+    """
+    Reads site configs from JSON files holding one config (such as
+    discover.py --format json writes) or a list of them
+    """
+    sites = []
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+
+        for site in data if isinstance(data, list) else [data]:
+            if "url" not in site:
+                raise ValueError(f"{path}: every site config needs a 'url'")
+            sites.append({k: v for k, v in site.items() if k not in DISCOVERY_ONLY_KEYS})
+
+    return sites
+
+
+# ===============================
+# SCHEDULER
+# ===============================
+
+async def run_site_task(index, site, browser, slots):
+    """Run one site with its config active for this task only"""
+    async with slots:
+        overrides = online.merge_config(BATCH_CONFIG["site_defaults"], site)
+        # Sites on one host starting in the same second would share a name otherwise
+        root = os.path.splitext(online.create_log_file(site["url"]))[0]
+        log_file = f"{root}-site{index}.txt"
+        sink = ResultsSink(log_file, f"{root}-site{index}.jsonl", echo=False)
+        online.use_site_config(overrides, sink)
+
+        started = time.perf_counter()
+        try:
+            results = await online.run_site(browser)
+            error = None
+        except Exception as e:
+            results, error = [], str(e)
+        finally:
+            sink.close()
+
+        return {
+            "url": site["url"],
+            "log_file": log_file,
+            "wall_s": round(time.perf_counter() - started, 2),
+            "error": error,
+            "results": results
+        }
+
+
+async def run_batch(sites):
+    # Host limits are shared by every site on a host, and the launch profile
+    # also sets up each site's contexts (viewport, reduced motion), so both
+    # are batch-wide settings and go into the defaults
+    online.CONFIG.update({
+        "max_per_host": BATCH_CONFIG["max_per_host"],
+        "politeness_delay_ms": BATCH_CONFIG["politeness_delay_ms"],
+        "launch_profile": BATCH_CONFIG["launch_profile"],
+        "headless": None
+    })
+    profile = resolve_launch_profile(BATCH_CONFIG["launch_profile"])
+
+    async with async_playwright() as p:
+        browsers = [await online.launch_browser(p, profile) for _ in range(max(1, BATCH_CONFIG["browsers"]))]
+        slots = asyncio.Semaphore(BATCH_CONFIG["max_sites"])
+
+        try:
+            # Sites take the browsers in turn; each site gets its own contexts
+            tasks = [
+                asyncio.create_task(run_site_task(index, site, browser, slots))
+                for index, (site, browser) in enumerate(zip(sites, cycle(browsers)))
+            ]
+            return await asyncio.gather(*tasks)
+        finally:
+            for browser in browsers:
+                await browser.close()
+
+
+# ===============================
+# COMBINED REPORT
+# ===============================
+
+def summarize_site(site_run):
+    statuses = [r["status"] for r in site_run["results"]]
+    return {
+        "url": site_run["url"],
+        "cases": len(statuses),
+        "pass": statuses.count("PASS"),
+        "fail": statuses.count("FAIL"),
+        "error": statuses.count("ERROR"),
+        "inconclusive": sum(1 for r in site_run["results"] if r["actual"] is None and r["status"] != "ERROR"),
+        "wall_s": site_run["wall_s"],
+        "log_file": site_run["log_file"],
+        "site_error": site_run["error"]
+    }
+
+
+def format_report(site_runs, wall):
+    header = f"{'SITE':<45}{'CASES':>7}{'PASS':>6}{'FAIL':>6}{'ERROR':>7}{'INCONCL':>9}{'WALL s':>9}"
+    lines = [
+        "=" * len(header),
+        "BATCH FORM VALIDATION REPORT",
+        "=" * len(header),
+        f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        f"Sites: {len(site_runs)} | Browsers: {BATCH_CONFIG['browsers']} | Max sites: {BATCH_CONFIG['max_sites']}"
+        f" | Per host: {BATCH_CONFIG['max_per_host']} | Politeness: {BATCH_CONFIG['politeness_delay_ms']} ms",
+        f"Total wall time: {wall:.2f} s",
+        "",
+        header,
+        "-" * len(header)
+    ]
+
+    for site_run in site_runs:
+        s = summarize_site(site_run)
+        lines.append(
+            f"{s['url'][:44]:<45}{s['cases']:>7}{s['pass']:>6}{s['fail']:>6}"
+            f"{s['error']:>7}{s['inconclusive']:>9}{s['wall_s']:>9.2f}"
+        )
+        if s["site_error"]:
+            lines.append(f"    SITE ERROR: {s['site_error']}")
+
+    lines += ["", "FAILED CASES", "-" * len(header)]
+    failures = 0
+    for site_run in site_runs:
+        for r in site_run["results"]:
+            if r["status"] != "PASS":
+                failures += 1
+                lines.append(f"[{r['status']}] {site_run['url']} | {r['field']}: {r['input']!r} → {r['reason']}")
+    if not failures:
+        lines.append("None")
+
+    return "\n".join(lines)
+
+
+# ===============================
+# MAIN EXECUTION
+# ===============================
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Run the online form tests for many sites on a shared browser pool")
+    parser.add_argument("configs", nargs="+", help="site config JSON files (one config or a list each)")
+    parser.add_argument("--browsers", type=int, default=BATCH_CONFIG["browsers"])
+    parser.add_argument("--max-sites", type=int, default=BATCH_CONFIG["max_sites"])
+    parser.add_argument("--max-per-host", type=int, default=BATCH_CONFIG["max_per_host"])
+    parser.add_argument("--politeness-delay-ms", type=int, default=BATCH_CONFIG["politeness_delay_ms"])
+    parser.add_argument("--profile", default=BATCH_CONFIG["launch_profile"], help="launch profile (see launch_profiles.py)")
+    parser.add_argument("--output", help="also write per-site summaries and results as JSON to this file")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    BATCH_CONFIG.update({
+        "browsers": args.browsers,
+        "max_sites": args.max_sites,
+        "max_per_host": args.max_per_host,
+        "politeness_delay_ms": args.politeness_delay_ms,
+        "launch_profile": args.profile
+    })
+
+    sites = load_sites(args.configs)
+
+    started = time.perf_counter()
+    site_runs = asyncio.run(run_batch(sites))
+    wall = time.perf_counter() - started
+
+    report = format_report(site_runs, wall)
+    report_file = f"batch_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+    with open(report_file, "w", encoding="utf-8") as f:
+        f.write(report + "\n")
+    print(report)
+    print(f"\nReport saved to: {report_file}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({
+                "config": BATCH_CONFIG,
+                "sites": [dict(summarize_site(r), results=r["results"]) for r in site_runs]
+            }, f, indent=2, ensure_ascii=False, default=str)
@@ -0,0 +1,295 @@
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+from launch_profiles import LAUNCH_PROFILES
+from timing import percentile
+
+try:
+    import resource
+except ImportError:  # Windows has no getrusage
+    resource = None
+
+
+# ===============================
+# BENCHMARK CONFIGURATION
+# ===============================
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+BENCHMARK_CONFIG = {
+    "host": "127.0.0.1",
+    "port": 8765,
+    "latency_ms": 0,           # artificial delay before every HTTP response
+    "validation_delay_ms": 0,  # busy loop injected into the form's submit handler
+    "runners": ["selenium", "playwright"],
+    "pool_size": 1,            # Selenium drivers / Playwright contexts
+    "launch_profile": "ci",    # see launch_profiles.py
+    "headless": True
+}
+
+# online.py field mapping for the bundled index.html (it only has ids)
+PLAYWRIGHT_FIELDS = {
+    "email": {"selector": "#email", "type": "email", "enabled": True},
+    "password": {"selector": "#password", "type": "password", "enabled": True},
+    "confirm_password": {
+        "selector": "#password_confirmation",
+        "type": "password_confirm",
+        "enabled": True,
+        "depends_on": "password"
+    },
+    "dob": {"selector": "#dob", "type": "date", "enabled": True}
+}
+
+PLAYWRIGHT_SUBMIT_SELECTOR = "button.submit-btn"
+
+
+# ===============================
+# LOCAL TEST SERVER
+# ===============================
+
+class BenchmarkRequestHandler(SimpleHTTPRequestHandler):
+    """
+    Serves the repo's index.html/success.html with optional latency
+    and a deliberately slow submit handler
+    """
+
+    latency_ms = 0
+    validation_delay_ms = 0
+
+    def do_GET(self):
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+
+        if self.validation_delay_ms and self.path.split("?")[0] in ("/", "/index.html"):
+            self.send_slow_form()
+        else:
+            super().do_GET()
+
+    def send_slow_form(self):
+        with open(os.path.join(REPO_DIR, "index.html"), encoding="utf-8") as f:
+            html = f.read()
+
+        # Capture-phase listener runs before the form's own submit handler
+        slow_script = f"""
+<script>
+    document.addEventListener("submit", function () {{
+        const end = performance.now() + {self.validation_delay_ms};
+        while (performance.now() < end) {{}}
+    }}, true);
+</script>
+"""
+        body = html.replace("</body>", slow_script + "</body>").encode("utf-8")
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server(config):
+    """Start the local form server on a background thread"""
+    handler = partial(BenchmarkRequestHandler, directory=REPO_DIR)
+    BenchmarkRequestHandler.latency_ms = config["latency_ms"]
+    BenchmarkRequestHandler.validation_delay_ms = config["validation_delay_ms"]
+
+    server = ThreadingHTTPServer((config["host"], config["port"]), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+# ===============================
+# RUNNERS (each in its own process)
+# ===============================
+
+def peak_rss_mb():
+    """Peak RSS of this process and of its largest finished child, in MB"""
+    if resource is None:
+        return None, None
+
+    # ru_maxrss is KB on Linux and bytes on macOS
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / scale
+    return round(own, 1), round(children, 1)
+
+
+def run_selenium(url, config):
+    import offline
+
+    offline.WEBSITE_URL = url
+    tester = offline.FormValidationTester(
+        pool_size=config["pool_size"],
+        headless=config["headless"],
+        launch_profile=config["launch_profile"]
+    )
+
+    try:
+        started = time.perf_counter()
+        tester.run_all_tests()
+        wall = time.perf_counter() - started
+    finally:
+        tester.close()
+
+    return wall, tester.report.aggregate.timings.values("total")
+
+
+def run_playwright(url, config):
+    import online
+    from results_sink import ResultsSink
+
+    online.CONFIG.update({
+        "url": url,
+        "submit_selector": PLAYWRIGHT_SUBMIT_SELECTOR,
+        "fields": PLAYWRIGHT_FIELDS,
+        "workers": config["pool_size"],
+        "launch_profile": config["launch_profile"],
+        "headless": config["headless"]
+    })
+    online.SINK = ResultsSink(echo=False)
+
+    started = time.perf_counter()
+    results = asyncio.run(online.run())
+    wall = time.perf_counter() - started
+
+    online.SINK.close()
+    return wall, [r["timings"].get("total", 0.0) for r in results if r.get("timings")]
+
+
+RUNNERS = {
+    "selenium": run_selenium,
+    "playwright": run_playwright
+}
+
+
+def benchmark_runner(name, url, config, results):
+    """Child-process entry point: run one runner and report its metrics"""
+    sys.path.insert(0, REPO_DIR)
+    os.chdir(tempfile.mkdtemp(prefix=f"bench-{name}-"))  # keep logs/reports out of the repo
+
+    wall, latencies = RUNNERS[name](url, config)
+    own_rss, browser_rss = peak_rss_mb()
+
+    results.put({
+        "runner": name,
+        "cases": len(latencies),
+        "wall_s": round(wall, 2),
+        "cases_per_s": round(len(latencies) / wall, 2) if wall else 0.0,
+        "p50_ms": percentile(latencies, 50),
+        "p95_ms": percentile(latencies, 95),
+        "max_ms": max(latencies) if latencies else 0.0,
+        "peak_rss_mb": own_rss,
+        "peak_browser_rss_mb": browser_rss
+    })
+
+
+# ===============================
+# REPORT
+# ===============================
+
+def format_report(config, metrics):
+    header = (
+        f"{'RUNNER':<12}{'CASES':>7}{'WALL s':>9}{'CASES/s':>9}"
+        f"{'P50 ms':>10}{'P95 ms':>10}{'MAX ms':>10}{'RSS MB':>9}{'BROWSER MB':>12}"
+    )
+    lines = [
+        "=" * len(header),
+        "FORM RUNNER BENCHMARK",
+        "=" * len(header),
+        f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        f"Latency: {config['latency_ms']} ms | Validation delay: {config['validation_delay_ms']} ms"
+        f" | Pool size: {config['pool_size']} | Profile: {config['launch_profile']}"
+        f" | Headless: {config['headless']}",
+        "",
+        header,
+        "-" * len(header)
+    ]
+
+    for m in metrics:
+        if "error" in m:
+            lines.append(f"{m['runner']:<12}ERROR: {m['error']}")
+            continue
+        lines.append(
+            f"{m['runner']:<12}{m['cases']:>7}{m['wall_s']:>9.2f}{m['cases_per_s']:>9.2f}"
+            f"{m['p50_ms']:>10.1f}{m['p95_ms']:>10.1f}{m['max_ms']:>10.1f}"
+            f"{m['peak_rss_mb'] if m['peak_rss_mb'] is not None else 'n/a':>9}"
+            f"{m['peak_browser_rss_mb'] if m['peak_browser_rss_mb'] is not None else 'n/a':>12}"
+        )
+
+    return "\n".join(lines)
+
+
+def run_benchmark(config):
+    server = start_server(config)
+    url = f"http://{config['host']}:{config['port']}/index.html"
+
+    ctx = multiprocessing.get_context("spawn")
+    metrics = []
+
+    try:
+        for name in config["runners"]:
+            results = ctx.Queue()
+            process = ctx.Process(target=benchmark_runner, args=(name, url, config, results))
+            process.start()
+            process.join()
+
+            if results.empty():
+                metrics.append({"runner": name, "error": f"exited with code {process.exitcode}"})
+            else:
+                metrics.append(results.get())
+    finally:
+        server.shutdown()
+
+    return metrics
+
+
+# ===============================
+# MAIN EXECUTION
+# ===============================
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark the form runners against the bundled index.html")
+    parser.add_argument("--runner", action="append", choices=sorted(RUNNERS), help="runner to benchmark (repeatable)")
+    parser.add_argument("--port", type=int, default=BENCHMARK_CONFIG["port"])
+    parser.add_argument("--latency-ms", type=int, default=BENCHMARK_CONFIG["latency_ms"])
+    parser.add_argument("--validation-delay-ms", type=int, default=BENCHMARK_CONFIG["validation_delay_ms"])
+    parser.add_argument("--pool-size", type=int, default=BENCHMARK_CONFIG["pool_size"])
+    parser.add_argument("--profile", default=BENCHMARK_CONFIG["launch_profile"], choices=sorted(LAUNCH_PROFILES))
+    parser.add_argument("--headed", action="store_true", help="show the browser windows")
+    parser.add_argument("--output", help="also write the metrics as JSON to this file")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+
+    config = dict(BENCHMARK_CONFIG)
+    config.update({
+        "port": args.port,
+        "latency_ms": args.latency_ms,
+        "validation_delay_ms": args.validation_delay_ms,
+        "pool_size": args.pool_size,
+        "launch_profile": args.profile,
+        "headless": not args.headed,
+        "runners": args.runner or BENCHMARK_CONFIG["runners"]
+    })
+
+    metrics = run_benchmark(config)
+    print(format_report(config, metrics))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"config": config, "metrics": metrics}, f, indent=2)
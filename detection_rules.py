@@ -0,0 +1,144 @@
+import json
+import os
+import re
+from urllib.parse import urlparse
+
+
+# ===============================
+# DECLARATIVE DETECTION RULES
+# ===============================
+#
+# A rule set has one group per check:
+#
+#   {
+#       "inline_error": {"keywords": [...], "regexes": [...], "selectors": [...]},
+#       "success_url":  {"keywords": [...], "regexes": [...]}
+#   }
+#
+# A rules file may add to the built-in rules with:
+#
+#   "default": {...}              rule set applied to every site
+#   "locales": {"es": {...}}      rule sets picked by locale
+#   "sites":   {"host": {...}}    rule set for one host (subdomains included);
+#                                 it may list its own "locales"
+#
+# Lists are appended to the rules underneath; a group with "replace": true
+# replaces them instead. Keywords are plain substrings; regexes must be valid
+# in both Python and JavaScript, since inline errors are matched in the page.
+# Everything is case-insensitive.
+#
+# detection_rules.json ships the locale rule sets only; see
+# detection_rules.example.json for "default" and "sites". A relative rules
+# path is resolved against this directory, not the working directory.
+
+RULES_DIR = os.path.dirname(os.path.abspath(__file__))
+
+RULE_GROUPS = {
+    "inline_error": ("keywords", "regexes", "selectors"),
+    "success_url": ("keywords", "regexes")
+}
+
+
+def empty_rules():
+    return {group: {key: [] for key in keys} for group, keys in RULE_GROUPS.items()}
+
+
+def merge_rules(base, override):
+    """Returns `base` with the groups of `override` appended (or replaced)"""
+    merged = {group: {key: list(values) for key, values in rules.items()} for group, rules in base.items()}
+
+    for group, keys in RULE_GROUPS.items():
+        rules = (override or {}).get(group)
+        if not rules:
+            continue
+        if rules.get("replace"):
+            merged[group] = {key: [] for key in keys}
+        for key in keys:
+            merged[group][key].extend(rules.get(key, []))
+
+    return merged
+
+
+def host_matches(host, site):
+    return host == site or host.endswith("." + site)
+
+
+def load_rules(base, path=None, url=None, locales=()):
+    """
+    Layers the rules file (if it exists) over `base`:
+    default, then the requested locales, then the site matching `url`
+    """
+    rules = merge_rules(empty_rules(), base)
+    if path and not os.path.isabs(path):
+        path = os.path.join(RULES_DIR, path)
+    if not path or not os.path.exists(path):
+        return rules
+
+    with open(path, encoding="utf-8") as f:
+        spec = json.load(f)
+
+    host = urlparse(url or "").hostname or ""
+    sites = [rules_ for site, rules_ in spec.get("sites", {}).items() if host_matches(host, site)]
+
+    wanted = list(locales)
+    for site_rules in sites:
+        wanted.extend(site_rules.get("locales", []))
+
+    rules = merge_rules(rules, spec.get("default"))
+    for locale in dict.fromkeys(wanted):
+        rules = merge_rules(rules, spec.get("locales", {}).get(locale))
+    for site_rules in sites:
+        rules = merge_rules(rules, site_rules)
+
+    return rules
+
+
+# Python-only syntax a page-side RegExp rejects: named groups/backreferences
+# in Python's form, inline flags, comments, \A and \Z
+PYTHON_ONLY_SYNTAX = re.compile(r"\(\?P[<=>]|\(\?[aiLmsux-]+[:)]|\(\?#|\\[AZ]")
+
+
+def check_regex(pattern):
+    """Raises ValueError for a rule regex that does not work in both Python and JavaScript"""
+    try:
+        re.compile(pattern)
+    except re.error as e:
+        raise ValueError(f"invalid detection rule regex {pattern!r}: {e}") from None
+    if PYTHON_ONLY_SYNTAX.search(pattern):
+        raise ValueError(f"detection rule regex {pattern!r} uses syntax JavaScript does not support")
+
+
+def combined_pattern(keywords, regexes):
+    """
+    One alternation for every keyword and regex, longest keywords first.
+    Returns None when there is nothing to match.
+    """
+    keywords = sorted({k.lower() for k in keywords if k}, key=len, reverse=True)
+    for r in regexes:
+        check_regex(r)
+    parts = [re.escape(k) for k in keywords] + [f"(?:{r})" for r in regexes if r]
+    return "|".join(parts) or None
+
+
+class CompiledRules:
+    """
+    A rule set compiled once into a single matcher per check.
+    `inline_error_source` is handed to the page script as a RegExp source.
+    """
+
+    def __init__(self, rules):
+        inline = rules["inline_error"]
+        success_url = rules["success_url"]
+
+        self.inline_error_source = combined_pattern(inline["keywords"], inline["regexes"])
+        self.inline_error_selectors = list(dict.fromkeys(inline["selectors"]))
+
+        source = combined_pattern(success_url["keywords"], success_url["regexes"])
+        self.success_url_re = re.compile(source, re.IGNORECASE) if source else None
+
+    def match_success_url(self, url):
+        """The part of `url` that marks it as a success page, or None"""
+        if self.success_url_re is None:
+            return None
+        match = self.success_url_re.search(url)
+        return match.group(0) if match else None
@@ -0,0 +1,423 @@
+import argparse
+import asyncio
+import json
+import re
+from collections import Counter
+from pprint import pformat
+
+from launch_profiles import resolve_launch_profile
+from page_scripts import INTERACTABILITY_JS
+from playwright.async_api import async_playwright
+
+
+# ===============================
+# PAGE-SIDE DISCOVERY
+# ===============================
+
+# Lists every interactable field and button with the attributes the type
+# inference needs, in document order, in one evaluate round-trip
+DISCOVERY_SCRIPT = """
+    () => {
+""" + INTERACTABILITY_JS + """
+        const labelFor = (el) => {
+            if (el.labels && el.labels.length) {
+                return el.labels[0].innerText.trim();
+            }
+            return (el.getAttribute('aria-label') || '').trim();
+        };
+
+        const fields = [];
+        const buttons = [];
+
+        for (const el of document.querySelectorAll('input, select, textarea, button')) {
+            const s = window.getComputedStyle(el);
+            const rect = el.getBoundingClientRect();
+            const type = (el.type || '').toLowerCase();
+
+            if (type === 'hidden' || !isInteractable(el, s, rect)) {
+                continue;
+            }
+
+            if (el.tagName === 'BUTTON' || ['submit', 'button', 'reset'].includes(type)) {
+                buttons.push({
+                    tag: el.tagName.toLowerCase(),
+                    type: type,
+                    id: el.id || '',
+                    className: el.getAttribute('class') || '',
+                    text: (el.innerText || el.value || '').trim()
+                });
+                continue;
+            }
+
+            fields.push({
+                tag: el.tagName.toLowerCase(),
+                type: type,
+                id: el.id || '',
+                name: el.name || '',
+                value: el.value || '',
+                label: labelFor(el),
+                placeholder: el.placeholder || '',
+                autocomplete: el.getAttribute('autocomplete') || '',
+                inputmode: el.getAttribute('inputmode') || '',
+                pattern: el.getAttribute('pattern') || '',
+                maxlength: el.maxLength > 0 ? el.maxLength : null,
+                required: !!el.required,
+                options: el.tagName === 'SELECT'
+                    ? Array.from(el.options).map(o => ({ value: o.value, label: o.label.trim() }))
+                    : null
+            });
+        }
+
+        return { fields, buttons };
+    }
+"""
+
+
+# ===============================
+# TYPE INFERENCE
+# ===============================
+
+CONFIRM_HINTS = ("confirm", "confirmation", "repeat", "retype", "again", "password2")
+NAME_HINTS = ("name", "given-name", "family-name", "first", "last", "surname")
+DATE_HINTS = ("dob", "birth", "bday")
+DIGIT_PATTERN = re.compile(r"^(\\d|\[0-9\])")
+NUMBERED_ID = re.compile(r"^(.*?)[-_]?(\d+)$")
+
+SUBMIT_TEXT = re.compile(r"submit|register|sign ?up|create|continue|next|log ?in|sign ?in|send|verify", re.I)
+
+# Offline runner keys (FIELD_IDS / FIELDS_TO_TEST) that have test data
+OFFLINE_KEYS = (
+    "name", "age", "email", "password", "confirm_password",
+    "dob", "gender", "address", "country", "phone", "otp"
+)
+
+
+def hints(field):
+    """Lowercased identifying text of a field"""
+    return " ".join(
+        field[key] for key in ("id", "name", "label", "placeholder", "autocomplete")
+    ).lower()
+
+
+def infer_type(field):
+    """
+    Maps a field to an online.py field type (the TEST_DATA key it is tested with)
+    """
+    html_type = field["type"]
+    text = hints(field)
+
+    if field["tag"] == "select":
+        return "select"
+    if html_type == "radio":
+        return "radio"
+    if html_type == "email" or "email" in text:
+        return "email"
+    if html_type == "password":
+        return "password_confirm" if any(h in text for h in CONFIRM_HINTS) else "password"
+    if html_type == "date" or any(h in text for h in DATE_HINTS):
+        return "date"
+    if (
+        html_type in ("number", "tel") or
+        field["inputmode"] in ("numeric", "tel", "decimal") or
+        field["autocomplete"] in ("tel", "one-time-code") or
+        DIGIT_PATTERN.match(field["pattern"])
+    ):
+        return "numeric"
+    if any(h in text for h in NAME_HINTS):
+        return "alpha"
+    return "text"
+
+
+def find_otp_groups(fields):
+    """
+    Runs of 4+ text/number boxes sharing an id/name prefix with consecutive
+    numbers (otp1..otp6), or single-character boxes side by side.
+    Returns lists of field indexes.
+    """
+    groups = []
+    run = []
+
+    def close_run():
+        if len(run) >= 4:
+            groups.append(list(run))
+        run.clear()
+
+    previous = None
+    for i, field in enumerate(fields):
+        if field["tag"] != "input" or field["type"] not in ("text", "number", "tel", "password", ""):
+            close_run()
+            previous = None
+            continue
+
+        match = NUMBERED_ID.match(field["id"] or field["name"])
+        key = (match.group(1), int(match.group(2))) if match else None
+        single_char = field["maxlength"] == 1
+
+        continues = run and (
+            (key and previous and key[0] == previous[0] and key[1] == previous[1] + 1) or
+            (single_char and fields[run[-1]]["maxlength"] == 1)
+        )
+        if not continues:
+            close_run()
+        if key or single_char:
+            run.append(i)
+        previous = key
+
+    close_run()
+    return groups
+
+
+def css_selector(field, counts):
+    """A plain CSS selector for a field, by unique id, then name"""
+    if field["id"] and counts["id", field["id"]] == 1:
+        return f"#{field['id']}"
+    if field["name"]:
+        return f"{field['tag']}[name='{field['name']}']"
+    return None
+
+
+def field_key(field, ftype, taken):
+    """A readable config key for a field"""
+    semantic = {
+        "email": "email",
+        "password": "password",
+        "password_confirm": "confirm_password",
+        "date": "dob"
+    }.get(ftype)
+
+    raw = semantic or field["name"] or field["id"] or field["label"] or ftype
+    key = re.sub(r"[^a-z0-9]+", "_", raw.lower()).strip("_") or ftype
+
+    candidate, n = key, 2
+    while candidate in taken:
+        candidate = f"{key}_{n}"
+        n += 1
+    return candidate
+
+
+def pick_submit(buttons):
+    """The most likely submit button and a selector for it"""
+    ranked = (
+        [b for b in buttons if b["type"] == "submit"] +
+        [b for b in buttons if b["type"] != "reset" and SUBMIT_TEXT.search(b["text"])]
+    )
+    if not ranked:
+        return None
+
+    button = ranked[0]
+    if button["id"]:
+        return f"{button['tag']}#{button['id']}"
+
+    same_type = [b for b in buttons if b["tag"] == button["tag"] and b["type"] == button["type"]]
+    if button["type"] and len(same_type) == 1:
+        return f"{button['tag']}[type={button['type']}]"
+
+    classes = button["className"].split()
+    if classes:
+        return f"{button['tag']}.{classes[0]}"
+    return f"{button['tag']}:has-text('{button['text']}')"
+
+
+def build_config(url, discovered):
+    """
+    Turns the discovered fields into online.py CONFIG fields and
+    offline.py FIELD_IDS / FIELDS_TO_TEST
+    """
+    fields = discovered["fields"]
+    counts = Counter(("id", f["id"]) for f in fields if f["id"])
+
+    online_fields = {}
+    field_ids = {}
+    notes = []
+
+    otp_groups = find_otp_groups(fields)
+    in_group = {i: group for group in otp_groups for i in group}
+    radio_groups = {}
+
+    for i, field in enumerate(fields):
+        if i in in_group:
+            group = in_group[i]
+            if i != group[0]:
+                continue
+
+            boxes = [fields[j] for j in group]
+            key = field_key({"name": "otp", "id": "", "label": ""}, "numeric", online_fields)
+            online_fields[key] = {
+                "selector": css_selector(field, counts),
+                "type": "numeric",
+                "enabled": False,
+                "boxes": [css_selector(box, counts) for box in boxes]
+            }
+            field_ids.setdefault("otp", [box["id"] for box in boxes])
+            notes.append(f"'{key}' is a {len(boxes)}-box OTP group; online.py fills single inputs, so it is disabled")
+            continue
+
+        ftype = infer_type(field)
+
+        if ftype == "radio":
+            # online.py checks radios by [value=...], so the option is the real value;
+            # radios without a value attribute all submit "on"
+            option = field["value"] or "on"
+            group_name = field["name"] or field["id"]
+            if group_name in radio_groups:
+                options = radio_groups[group_name]["options"]
+                if option not in options:
+                    options.append(option)
+                else:
+                    note = f"radios in '{group_name}' share the value '{option}' and cannot be told apart"
+                    if note not in notes:
+                        notes.append(note)
+                continue
+
+            key = field_key(field, ftype, online_fields)
+            radio_groups[group_name] = online_fields[key] = {
+                "selector": f"input[name='{field['name']}']" if field["name"] else f"#{field['id']}",
+                "type": "radio",
+                "options": [option],
+                "enabled": False
+            }
+            if "gender" in hints(field):
+                field_ids.setdefault("gender", {})
+            continue
+
+        selector = css_selector(field, counts)
+        if selector is None:
+            notes.append(f"skipped a {field['tag']} with neither id nor name")
+            continue
+
+        key = field_key(field, ftype, online_fields)
+        entry = {"selector": selector, "type": ftype, "enabled": ftype != "text"}
+
+        if ftype == "select":
+            labels = [o["label"] for o in field["options"] if o["value"]]
+            entry["value"] = labels[0] if labels else ""
+            entry["enabled"] = False
+
+        if ftype == "password_confirm":
+            passwords = [k for k, f in online_fields.items() if f["type"] == "password"]
+            if passwords:
+                entry["depends_on"] = passwords[-1]
+            else:
+                entry["type"] = "password"
+
+        online_fields[key] = entry
+
+        # Offline keys come from what the field is, not what it is called
+        offline_key = {
+            "email": "email",
+            "password": "password",
+            "password_confirm": "confirm_password",
+            "date": "dob",
+            "select": "country" if "country" in hints(field) else None,
+            "alpha": "name" if "name" in hints(field) else None
+        }.get(ftype)
+        if ftype in ("numeric", "text"):
+            for candidate in ("age", "phone", "address"):
+                if candidate in hints(field) or (candidate == "phone" and field["type"] == "tel"):
+                    offline_key = candidate
+                    break
+        if offline_key and field["id"] and offline_key not in field_ids:
+            field_ids[offline_key] = field["id"]
+
+    # Radio options need ids offline
+    if "gender" in field_ids:
+        field_ids["gender"] = {
+            f["id"].lower(): f["id"] for f in fields if f["type"] == "radio" and "gender" in hints(f) and f["id"]
+        }
+
+    submit_selector = pick_submit(discovered["buttons"])
+    if submit_selector is None:
+        notes.append("no submit button found; set submit_selector by hand")
+
+    return {
+        "url": url,
+        "submit_selector": submit_selector,
+        "fields": online_fields,
+        "offline": {
+            "FIELD_IDS": field_ids,
+            "FIELDS_TO_TEST": {key: key in field_ids for key in OFFLINE_KEYS}
+        },
+        "notes": notes
+    }
+
+
+# ===============================
+# DISCOVERY
+# ===============================
+
+async def discover(url, launch_profile="ci", timeout=15):
+    """Load `url` once and return the generated config"""
+    profile = resolve_launch_profile(launch_profile)
+
+    async with async_playwright() as p:
+        options = {"headless": profile["headless"], "args": profile["args"]}
+        if profile["channel"]:
+            options["channel"] = profile["channel"]
+        browser = await p.chromium.launch(**options)
+
+        try:
+            page = await browser.new_page()
+            await page.goto(url, wait_until="domcontentloaded", timeout=timeout * 1000)
+            try:
+                await page.wait_for_load_state("networkidle", timeout=timeout * 1000)
+            except Exception:
+                pass  # long-polling pages never go idle; the DOM is there already
+
+            discovered = await page.evaluate(DISCOVERY_SCRIPT)
+        finally:
+            await browser.close()
+
+    return build_config(url, discovered)
+
+
+def format_python(config):
+    """Config as Python ready to paste into online.py and offline.py"""
+    online = {
+        "url": config["url"],
+        "submit_selector": config["submit_selector"],
+        "fields": config["fields"]
+    }
+    lines = [
+        "# ---- online.py ----",
+        f"CONFIG.update({pformat(online, sort_dicts=False, width=100)})",
+        "",
+        "# ---- offline.py ----",
+        f"WEBSITE_URL = {config['url']!r}",
+        f"FIELDS_TO_TEST = {pformat(config['offline']['FIELDS_TO_TEST'], sort_dicts=False)}",
+        f"FIELD_IDS = {pformat(config['offline']['FIELD_IDS'], sort_dicts=False)}"
+    ]
+    if config["notes"]:
+        lines.append("")
+        lines.extend(f"# NOTE: {note}" for note in config["notes"])
+    return "\n".join(lines)
+
+
+# ===============================
+# MAIN EXECUTION
+# ===============================
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Discover a form's fields and generate runner config")
+    parser.add_argument("url", help="page with the form")
+    parser.add_argument("--format", choices=("python", "json"), default="python")
+    parser.add_argument("--output", help="write the config to this file instead of stdout")
+    parser.add_argument("--profile", default="ci", help="launch profile (see launch_profiles.py)")
+    parser.add_argument("--timeout", type=int, default=15, help="seconds to wait for the page")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+
+    config = asyncio.run(discover(args.url, args.profile, args.timeout))
+    if args.format == "json":
+        text = json.dumps(config, indent=2, ensure_ascii=False)
+    else:
+        text = format_python(config)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+        print(f"Config written to {args.output}")
+    else:
+        print(text)
@@ -0,0 +1,115 @@
+import glob
+import json
+import os
+import shutil
+import subprocess
+import threading
+import time
+
+
+# ===============================
+# CHROMEDRIVER RESOLUTION
+# ===============================
+
+DRIVER_NAMES = ("chromedriver", "chromedriver.exe")
+
+# Where webdriver_manager keeps the drivers it already downloaded
+WDM_CACHE_GLOB = os.path.join(os.path.expanduser("~"), ".wdm", "drivers", "chromedriver", "**", "chromedriver*")
+
+_lock = threading.Lock()
+_resolved = {}
+
+
+def is_executable(path):
+    return bool(path) and os.path.isfile(path) and os.access(path, os.X_OK)
+
+
+def driver_version(path):
+    """Version reported by `chromedriver --version`, or None if it cannot run"""
+    try:
+        output = subprocess.run([path, "--version"], capture_output=True, text=True, timeout=5).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    parts = output.split()
+    return parts[1] if len(parts) > 1 else None
+
+
+def read_manifest(manifest_path):
+    try:
+        with open(manifest_path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def write_manifest(manifest_path, entry):
+    tmp_path = f"{manifest_path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(entry, f, indent=2)
+    os.replace(tmp_path, manifest_path)
+
+
+def find_local_driver():
+    """
+    Looks for a chromedriver without touching the network: first on PATH,
+    then the newest one webdriver_manager already downloaded
+    """
+    for name in DRIVER_NAMES:
+        path = shutil.which(name)
+        if is_executable(path):
+            return path, "path"
+
+    cached = [p for p in glob.glob(WDM_CACHE_GLOB, recursive=True)
+              if os.path.basename(p) in DRIVER_NAMES and is_executable(p)]
+    if cached:
+        return max(cached, key=os.path.getmtime), "wdm_cache"
+
+    return None, None
+
+
+def download_driver():
+    """Last resort: let webdriver_manager check versions and download"""
+    from webdriver_manager.chrome import ChromeDriverManager
+    return ChromeDriverManager().install(), "download"
+
+
+def resolve_chromedriver(manifest_path=".chromedriver.json", explicit_path=None, refresh=False):
+    """
+    Returns the chromedriver path to start every pooled driver with.
+
+    Resolution happens at most once per process and manifest. The manifest
+    records the path and version so later runs start without a lookup; it is
+    ignored when the recorded file is gone. `refresh` skips the manifest and
+    local copies and downloads a driver matching the installed Chrome, for
+    when a cached driver no longer fits the browser.
+    """
+    with _lock:
+        if not refresh and manifest_path in _resolved:
+            return _resolved[manifest_path]
+
+        if explicit_path:
+            if not is_executable(explicit_path):
+                raise FileNotFoundError(f"chromedriver not found or not executable: {explicit_path}")
+            _resolved[manifest_path] = explicit_path
+            return explicit_path
+
+        path = source = None
+        if not refresh:
+            manifest = read_manifest(manifest_path)
+            if manifest and is_executable(manifest.get("path")):
+                _resolved[manifest_path] = manifest["path"]
+                return manifest["path"]
+
+            path, source = find_local_driver()
+
+        if path is None:
+            path, source = download_driver()
+
+        write_manifest(manifest_path, {
+            "path": os.path.abspath(path),
+            "version": driver_version(path),
+            "source": source,
+            "resolved_at": time.strftime("%Y-%m-%d %H:%M:%S")
+        })
+        _resolved[manifest_path] = path
+        return path
@@ -0,0 +1,56 @@
+# ===============================
+# BROWSER LAUNCH PROFILES
+# Shared by online.py (Playwright) and offline.py (Selenium)
+# ===============================
+
+# Chrome switches that cut work a display-less run never benefits from
+LOW_OVERHEAD_ARGS = [
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--disable-dev-shm-usage",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--mute-audio"
+]
+
+LAUNCH_PROFILES = {
+    # Full visible browser, maximized, for watching a run locally
+    "visible": {
+        "headless": False,
+        "channel": None,
+        "args": [],
+        "viewport": None,          # None keeps the runner's default window/viewport
+        "reduced_motion": False,
+        "disk_cache_dir": None
+    },
+
+    # New headless mode with the low-overhead switches, a small fixed
+    # viewport and no animations, so several instances fit on one core
+    "ci": {
+        "headless": True,
+        "channel": "chromium",  # Playwright: new headless mode rather than the headless shell
+        "args": LOW_OVERHEAD_ARGS,
+        "viewport": {"width": 1024, "height": 768},
+        "reduced_motion": True,
+        "disk_cache_dir": ".browser_cache"  # kept between runs; one subdirectory per browser
+    }
+}
+
+
+def resolve_launch_profile(name, headless=None):
+    """
+    Returns a copy of the named profile; `headless` overrides the
+    profile's own setting when it is not None
+    """
+    if name not in LAUNCH_PROFILES:
+        raise ValueError(f"Unknown launch profile '{name}', expected one of {sorted(LAUNCH_PROFILES)}")
+
+    profile = dict(LAUNCH_PROFILES[name])
+    profile["args"] = list(profile["args"])
+    if headless is not None:
+        profile["headless"] = headless
+    return profile
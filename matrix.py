@@ -0,0 +1,81 @@
+from itertools import combinations, product
+
+
+# ===============================
+# COMBINATORIAL TEST MATRIX
+# ===============================
+
+def covering_rows(parameters, strength=2):
+    """
+    Lazily yields rows ({name: value}) covering every combination of
+    `strength` parameter values at least once (pairwise for strength=2).
+
+    `parameters` maps each parameter name to its list of candidate values.
+    Rows are built greedily and deterministically: each row starts from the
+    oldest uncovered combination and every other parameter takes the value
+    covering the most still-uncovered combinations, so the row count grows
+    roughly logarithmically with the number of parameters.
+    """
+    names = [name for name, values in parameters.items() if values]
+    values = [list(parameters[name]) for name in names]
+    strength = max(1, min(strength, len(names)))
+
+    if not names:
+        return
+
+    # Uncovered t-way combinations as ((param indices), (value indices)),
+    # kept in insertion order so the walk is deterministic
+    uncovered = dict.fromkeys(
+        (params, picks)
+        for params in combinations(range(len(names)), strength)
+        for picks in product(*(range(len(values[p])) for p in params))
+    )
+
+    while uncovered:
+        seed_params, seed_picks = next(iter(uncovered))
+        row = dict(zip(seed_params, seed_picks))
+
+        for p in range(len(names)):
+            if p in row:
+                continue
+
+            best_pick, best_gain = 0, -1
+            for pick in range(len(values[p])):
+                gain = 0
+                for others in combinations(sorted(row), strength - 1):
+                    params = tuple(sorted(others + (p,)))
+                    picks = tuple(pick if q == p else row[q] for q in params)
+                    if (params, picks) in uncovered:
+                        gain += 1
+                if gain > best_gain:
+                    best_pick, best_gain = pick, gain
+            row[p] = best_pick
+
+        for params in combinations(range(len(names)), strength):
+            uncovered.pop((params, tuple(row[p] for p in params)), None)
+
+        yield {names[p]: values[p][row[p]] for p in range(len(names))}
+
+
+def deduplicate(cases, key=None):
+    """
+    Lazily drops cases equivalent to one already yielded.
+    `key` maps a case to a hashable identity (defaults to its sorted items).
+    """
+    key = key or (lambda case: tuple(sorted(case.items(), key=lambda item: item[0])))
+    seen = set()
+
+    for case in cases:
+        identity = key(case)
+        if identity in seen:
+            continue
+        seen.add(identity)
+        yield case
+
+
+def matrix_rows(parameters, mode="pairwise", strength=2, key=None):
+    """
+    Yields deduplicated rows for "pairwise" (strength 2) or "nwise" (`strength`)
+    """
+    strength = 2 if mode == "pairwise" else strength
+    return deduplicate(covering_rows(parameters, strength), key)
@@ -1,18 +1,186 @@
 import os
+import queue
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from datetime import datetime
+from launch_profiles import resolve_launch_profile
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import Select, WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import NoAlertPresentException, TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
+from selenium.common.exceptions import (
+    NoAlertPresentException, TimeoutException, NoSuchElementException, SessionNotCreatedException,
+    StaleElementReferenceException, WebDriverException
+)
+from driver_resolver import resolve_chromedriver
+from matrix import matrix_rows
+from prevalidation import CONSTRAINTS_SCRIPT, PreValidator
+from result_cache import ResultCache, form_fingerprint
+from report_pipeline import ReportPipeline
+from timing import PhaseTimer
 
 # ===============================
 # CONFIGURATION
 # ===============================
 WEBSITE_URL = "http://localhost:8080"
+SUBMIT_SETTLE_TIMEOUT = 1.5  # upper bound (seconds) to wait for a submit to settle
+
+# How the form is reset between test cases:
+#   "navigate" - reload WEBSITE_URL for every case
+#   "in_place" - reset the form DOM while still on the pristine form page, reload otherwise
+RESET_STRATEGY = "navigate"
+
+# What the user sees of the form: visible controls and visible text, without
+# values. A page whose signature differs from the one right after loading
+# (error messages, an advanced step) is not reset in place.
+FORM_SIGNATURE_SCRIPT = """
+    const isVisible = (el) => {
+        const s = window.getComputedStyle(el);
+        const rect = el.getBoundingClientRect();
+        return s.display !== 'none' && s.visibility !== 'hidden' && rect.width > 0 && rect.height > 0;
+    };
+    const controls = Array.from(document.querySelectorAll('input:not([type=hidden]), select, textarea, button'))
+        .filter(el => isVisible(el) && !el.disabled)
+        .map(el => `${el.tagName}#${el.id}[${el.name}]`);
+    const texts = Array.from(document.querySelectorAll('h1, h2, h3, h4, h5, h6, label, p, span, div'))
+        .filter(el => el.childElementCount === 0 && el.textContent.trim() && isVisible(el))
+        .map(el => el.textContent.trim());
+    return JSON.stringify([controls, texts]);
+"""
+
+# ===============================
+# DRIVER POOL CONFIGURATION
+# ===============================
+DRIVER_POOL_SIZE = 1       # Number of Chrome instances running test cases in parallel
+LAUNCH_PROFILE = 'visible' # see launch_profiles.py: 'visible' or 'ci'
+HEADLESS = None            # Overrides the profile's headless setting when not None
+
+# Resolved once, then read from the manifest so startup never hits the network.
+# Set CHROMEDRIVER_PATH to pin a driver explicitly.
+CHROMEDRIVER_PATH = None
+CHROMEDRIVER_MANIFEST = '.chromedriver.json'
+
+# ===============================
+# FORM FILLING
+#   'script' - set every value in one execute_script call, dispatching
+#              input/change/blur like a user would (fastest)
+#   'keys'   - clear + send_keys per field through cached element handles,
+#              keeping real keystroke semantics (maxlength, badInput)
+# ===============================
+FILL_MODE = 'script'
+
+# Steps are [element_id, value, action]; action is 'type', 'click' or 'select'.
+# Missing elements are skipped and reported back, as the form may not have
+# every configured field.
+FILL_SCRIPT = """
+    const setValue = (el, value) => {
+        const proto = el.tagName === 'TEXTAREA' ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+        Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, value);
+    };
+    const problems = [];
+    const missing = [];
+    
+    for (const [id, value, action] of arguments[0]) {
+        const el = document.getElementById(id);
+        if (!el) {
+            missing.push(id);
+            continue;
+        }
+        
+        if (action === 'click') {
+            el.click();
+            continue;
+        }
+        
+        if (action === 'select') {
+            const option = Array.from(el.options).find(o => o.text.trim() === value);
+            if (!option) {
+                problems.push(`${id}: no option with text '${value}'`);
+                continue;
+            }
+            el.value = option.value;
+            el.dispatchEvent(new Event('change', { bubbles: true }));
+            continue;
+        }
+        
+        // Keystrokes stop at maxlength, so assigned values do too
+        el.focus();
+        setValue(el, el.maxLength > 0 ? value.slice(0, el.maxLength) : value);
+        el.dispatchEvent(new Event('input', { bubbles: true }));
+        el.dispatchEvent(new Event('change', { bubbles: true }));
+        el.blur();
+    }
+    return [problems, missing];
+"""
+
+# ===============================
+# BATCHED INLINE MODE
+# Fields validated on blur/input get all their test values typed
+# into one loaded page; the page is reloaded only after a case
+# actually submits
+# ===============================
+BATCH_INLINE_MODE = False
+INLINE_VALIDATION_FIELDS = ['name', 'age', 'email', 'password', 'confirm_password', 'dob', 'address', 'phone']
+INLINE_ERROR_SELECTORS = ['.error', '.error-message', '.invalid-feedback', '.field-error', '[role="alert"]']
+INLINE_ERROR_TIMEOUT = 0.3  # seconds to wait for an inline error after blur
+
+# ===============================
+# TEST MATRIX
+#   'single'   - vary one field at a time against default values
+#   'pairwise' - cover every pair of test values across enabled fields
+#   'nwise'    - cover every combination of MATRIX_STRENGTH fields
+# ===============================
+MATRIX_MODE = 'single'
+MATRIX_STRENGTH = 3
+CASE_CHUNK_SIZE = 50  # cases pulled from the generator per pool run
+
+# ===============================
+# PRE-VALIDATION
+# Predict cases the form's HTML5 constraints block client-side
+# without a browser round-trip; a sample is still confirmed
+# ===============================
+PREVALIDATION = False
+PREVALIDATION_CONFIRM_RATE = 0.1
+PREDICTED_BLOCK = "Predicted client-side block:"  # reason prefix of predicted outcomes
+
+# ===============================
+# RESULT CACHE
+# Reuse verdicts from earlier runs while the form's structure is unchanged
+# ===============================
+RESULT_CACHE = False
+RESULT_CACHE_PATH = '.result_cache.sqlite'
+RESULT_CACHE_TTL_HOURS = 24
+RESULT_CACHE_VERIFY_RATE = 0.1  # fraction of cache hits re-run in the browser anyway
+
+# ===============================
+# RESOURCE BLOCKING
+# Applied through CDP Network.setBlockedURLs
+# ===============================
+BLOCK_RESOURCES = False
+BLOCKED_RESOURCE_TYPES = ['image', 'font', 'media']
+BLOCKED_URL_PATTERNS = [
+    '*google-analytics.com*',
+    '*googletagmanager.com*',
+    '*doubleclick.net*',
+    '*facebook.net*',
+    '*hotjar.com*'
+]
+
+# CDP can only block by URL, so resource types map to file extensions
+RESOURCE_TYPE_URL_PATTERNS = {
+    'image': ['*.png*', '*.jpg*', '*.jpeg*', '*.gif*', '*.webp*', '*.svg*', '*.ico*'],
+    'font': ['*.woff*', '*.woff2*', '*.ttf*', '*.otf*', '*.eot*'],
+    'media': ['*.mp4*', '*.webm*', '*.mp3*', '*.ogg*', '*.wav*']
+}
+
+# ===============================
+# REPORTS
+# Written incrementally while tests run: 'text', 'jsonl', 'junit', 'html'
+# ===============================
+REPORT_FORMATS = ['text', 'jsonl']
 
 # ===============================
 # FIELD CONFIGURATION
@@ -198,119 +366,297 @@ COUNTRY_DEFAULT = "India"
 # TEST CLASS
 # ===============================
 class FormValidationTester:
-    def __init__(self):
-        self.driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()))
-        self.driver.maximize_window()
-        self.wait = WebDriverWait(self.driver, 5)
-        self.test_results = []
-        self.vulnerabilities = []
-        self.total_tests = 0
-        self.passed_tests = 0
-        self.failed_tests = 0
-        self.skipped_fields = []
-        
-    def navigate_to_form(self):
-        """Navigate to the form page"""
-        self.driver.get(WEBSITE_URL)
-        time.sleep(1)
+    def __init__(self, pool_size=DRIVER_POOL_SIZE, headless=HEADLESS, launch_profile=LAUNCH_PROFILE):
+        self.profile = resolve_launch_profile(launch_profile, headless)
+        self.headless = self.profile['headless']
+        self.driver_path = resolve_chromedriver(CHROMEDRIVER_MANIFEST, CHROMEDRIVER_PATH)
+        self.driver_path_lock = threading.Lock()
+        self.driver_refreshed = False
+        
+        # Drivers start concurrently; each one only costs a process spawn
+        pool_size = max(1, pool_size)
+        with ThreadPoolExecutor(max_workers=pool_size) as executor:
+            self.drivers = list(executor.map(self.create_driver, range(pool_size)))
+        self.driver = self.drivers[0]
+        self.form_urls = {}
+        self.form_signatures = {}
+        self.element_cache = {}
+        self.prevalidator = None
+        self.result_cache = None
+        self.form_fingerprint = None
+        
+        # Results stream into every report format as they finish
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.report = ReportPipeline(
+            REPORT_FORMATS,
+            f"form_validation_report_{timestamp}",
+            WEBSITE_URL,
+            [field for field, enabled in FIELDS_TO_TEST.items() if enabled]
+        )
     
-    def field_exists(self, field_id):
-        """Check if a field exists on the page"""
+    @property
+    def total_tests(self):
+        return self.report.aggregate.total
+    
+    @property
+    def passed_tests(self):
+        return self.report.aggregate.passed
+    
+    @property
+    def failed_tests(self):
+        return self.report.aggregate.failed
+    
+    @property
+    def vulnerabilities(self):
+        return self.report.aggregate.vulnerabilities
+    
+    @property
+    def skipped_fields(self):
+        return self.report.aggregate.skipped_fields
+        
+    def create_driver(self, index=0):
+        """Start a Chrome instance for the driver pool"""
+        options = webdriver.ChromeOptions()
+        if self.headless:
+            options.add_argument("--headless=new")
+        for arg in self.profile['args']:
+            options.add_argument(arg)
+        
+        viewport = self.profile['viewport']
+        if viewport:
+            options.add_argument(f"--window-size={viewport['width']},{viewport['height']}")
+        if self.profile['reduced_motion']:
+            options.add_argument("--force-prefers-reduced-motion")
+        
+        # Each pooled browser keeps its own cache directory; Chrome does not share one between processes
+        if self.profile['disk_cache_dir']:
+            cache_dir = os.path.join(self.profile['disk_cache_dir'], f"driver-{index}")
+            options.add_argument(f"--disk-cache-dir={os.path.abspath(cache_dir)}")
+        
         try:
-            self.driver.find_element(By.ID, field_id)
-            return True
-        except NoSuchElementException:
+            driver = webdriver.Chrome(service=Service(self.driver_path), options=options)
+        except SessionNotCreatedException:
+            # The cached driver no longer matches the installed Chrome; the first
+            # pool thread to fail refreshes it, the others reuse its result
+            with self.driver_path_lock:
+                if not self.driver_refreshed:
+                    self.driver_path = resolve_chromedriver(CHROMEDRIVER_MANIFEST, refresh=True)
+                    self.driver_refreshed = True
+            driver = webdriver.Chrome(service=Service(self.driver_path), options=options)
+        if not self.headless and not viewport:
+            driver.maximize_window()
+        
+        if BLOCK_RESOURCES:
+            self.block_resources(driver)
+        return driver
+    
+    def block_resources(self, driver):
+        """Stop the browser from loading blocked resource types and URL patterns"""
+        patterns = list(BLOCKED_URL_PATTERNS)
+        for resource_type in BLOCKED_RESOURCE_TYPES:
+            patterns.extend(RESOURCE_TYPE_URL_PATTERNS.get(resource_type, []))
+        
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+    
+    def navigate_to_form(self, driver=None):
+        """Navigate to the form page"""
+        driver = driver or self.driver
+        
+        if RESET_STRATEGY == 'in_place' and self.reset_form_in_place(driver):
+            return
+        
+        driver.get(WEBSITE_URL)
+        self.element_cache.pop(driver, None)
+        WebDriverWait(driver, 5).until(EC.presence_of_element_located((By.TAG_NAME, "form")))
+        self.form_urls[driver] = driver.current_url
+        if RESET_STRATEGY == 'in_place':
+            self.form_signatures[driver] = driver.execute_script(FORM_SIGNATURE_SCRIPT)
+    
+    def reset_form_in_place(self, driver):
+        """Reset the form without reloading when the driver is still on the pristine form page"""
+        if self.form_urls.get(driver) != driver.current_url:
+            return False
+        
+        if driver.execute_script(FORM_SIGNATURE_SCRIPT) != self.form_signatures.get(driver):
             return False
+        
+        return driver.execute_script("""
+            const forms = Array.from(document.forms);
+            forms.forEach(form => form.reset());
+            return forms.length > 0;
+        """)
     
-    def fill_field(self, field_name, value):
-        """Fill a single field with error handling"""
-        try:
-            field_id = FIELD_IDS.get(field_name)
-            
-            if field_name == 'gender':
-                if value in field_id:
-                    gender_id = field_id[value]
-                    if self.field_exists(gender_id):
-                        self.driver.find_element(By.ID, gender_id).click()
-                return True
-            
-            elif field_name == 'country':
-                if self.field_exists(field_id):
-                    country_dropdown = Select(self.driver.find_element(By.ID, field_id))
-                    country_dropdown.select_by_visible_text(value)
-                return True
-            
-            elif field_name == 'otp':
-                if isinstance(field_id, list):
-                    otp_digits = list(value[:6])
-                    for i, digit in enumerate(otp_digits):
-                        if self.field_exists(field_id[i]):
-                            self.driver.find_element(By.ID, field_id[i]).clear()
-                            self.driver.find_element(By.ID, field_id[i]).send_keys(digit)
-                    
-                    for i in range(len(otp_digits), len(field_id)):
-                        if self.field_exists(field_id[i]):
-                            self.driver.find_element(By.ID, field_id[i]).clear()
-                else:
-                    if self.field_exists(field_id):
-                        self.driver.find_element(By.ID, field_id).clear()
-                        if value:
-                            self.driver.find_element(By.ID, field_id).send_keys(value)
-                return True
+    def field_exists(self, field_id, driver=None):
+        """Check if a field exists on the page"""
+        driver = driver or self.driver
+        return field_id in self.get_elements(driver)
+    
+    def lookup_elements(self, driver):
+        """Find every FIELD_IDS element on the current page in one round-trip"""
+        ids = []
+        for field_id in FIELD_IDS.values():
+            if isinstance(field_id, dict):
+                ids.extend(field_id.values())
+            elif isinstance(field_id, list):
+                ids.extend(field_id)
+            else:
+                ids.append(field_id)
+        
+        found = driver.execute_script("return arguments[0].map(id => document.getElementById(id));", ids)
+        self.element_cache[driver] = {field_id: el for field_id, el in zip(ids, found) if el is not None}
+        return self.element_cache[driver]
+    
+    def get_elements(self, driver):
+        """Element handles for the current page, looked up once per navigation"""
+        elements = self.element_cache.get(driver)
+        if elements is None:
+            elements = self.lookup_elements(driver)
+        return elements
+    
+    def fill_steps(self, field_name, value):
+        """(element_id, value, action) steps that enter one field's value"""
+        field_id = FIELD_IDS.get(field_name)
+        
+        if field_name == 'gender':
+            return [(field_id[value], None, 'click')] if value in field_id else []
+        
+        if field_name == 'country':
+            return [(field_id, value, 'select')]
+        
+        if field_name == 'otp' and isinstance(field_id, list):
+            digits = list(value[:6])
+            return [(otp_id, digits[i] if i < len(digits) else '', 'type') for i, otp_id in enumerate(field_id)]
+        
+        return [(field_id, '' if value is None else str(value), 'type')]
+    
+    def fill_fields(self, driver, values):
+        """Enter {field_name: value} into the form; returns the fields found on the page"""
+        steps = {field_name: self.fill_steps(field_name, value) for field_name, value in values.items()}
+        
+        if FILL_MODE == 'script':
+            problems, missing = driver.execute_script(FILL_SCRIPT, [step for s in steps.values() for step in s])
+            for problem in problems:
+                print(f"Error filling field: {problem}")
+            return [
+                field_name for field_name, field_steps in steps.items()
+                if field_steps and not any(step[0] in missing for step in field_steps)
+            ]
+        
+        filled = []
+        for field_name, field_steps in steps.items():
+            try:
+                try:
+                    present = self.type_steps(driver, field_steps)
+                except StaleElementReferenceException:
+                    # The page re-rendered since the lookup
+                    self.element_cache.pop(driver, None)
+                    present = self.type_steps(driver, field_steps)
+                if present:
+                    filled.append(field_name)
+            except Exception as e:
+                print(f"Error filling field {field_name}: {str(e)}")
+        return filled
+    
+    def type_steps(self, driver, steps):
+        """Apply fill steps with real keystrokes through the cached element handles"""
+        elements = self.get_elements(driver)
+        present = bool(steps)
+        
+        for element_id, value, action in steps:
+            el = elements.get(element_id)
+            if el is None:
+                present = False
+                continue
             
+            if action == 'click':
+                el.click()
+            elif action == 'select':
+                Select(el).select_by_visible_text(value)
             else:
-                if self.field_exists(field_id):
-                    self.driver.find_element(By.ID, field_id).clear()
-                    if value:
-                        self.driver.find_element(By.ID, field_id).send_keys(value)
-                    return True
-                else:
-                    return False
-                    
+                el.clear()
+                if value:
+                    el.send_keys(value)
+        
+        return present
+    
+    def fill_field(self, field_name, value, driver=None):
+        """Fill a single field with error handling"""
+        driver = driver or self.driver
+        try:
+            return field_name in self.fill_fields(driver, {field_name: value})
         except Exception as e:
             print(f"Error filling field {field_name}: {str(e)}")
             return False
     
-    def fill_form(self, **kwargs):
+    def fill_form(self, driver=None, **kwargs):
         """Fill the entire form with given data"""
+        driver = driver or self.driver
         try:
-            for field_name, value in kwargs.items():
-                if FIELDS_TO_TEST.get(field_name, False):
-                    self.fill_field(field_name, value)
+            self.fill_fields(driver, {
+                field_name: value for field_name, value in kwargs.items()
+                if FIELDS_TO_TEST.get(field_name, False)
+            })
             return True
         except Exception as e:
             print(f"Error filling form: {str(e)}")
             return False
     
-    def submit_form(self):
-        """Submit the form and check result"""
+    def submit_form(self, driver=None, timer=None):
+        """Submit the form and check result; success is None when no verdict was reached"""
+        driver = driver or self.driver
+        timer = timer or PhaseTimer()
         try:
-            submit_btn = self.wait.until(
-                EC.element_to_be_clickable((By.XPATH, "//button[contains(text(),'Register') or contains(text(),'Submit')]"))
-            )
+            with timer.phase('submit'):
+                submit_btn = WebDriverWait(driver, 5).until(
+                    EC.element_to_be_clickable((By.XPATH, "//button[contains(text(),'Register') or contains(text(),'Submit')]"))
+                )
+                
+                current_url = driver.current_url
+                submit_btn.click()
             
-            current_url = self.driver.current_url
-            submit_btn.click()
-            time.sleep(1.5)
+            with timer.phase('settle'):
+                self.wait_for_submit_settle(current_url, driver)
             
-            # Check if redirected or URL changed
-            new_url = self.driver.current_url
-            if new_url != current_url:
-                return True, "Form submitted successfully"
-            else:
-                # Check for any validation messages or if form is still visible
-                try:
-                    # Check if form still exists (validation failed)
-                    self.driver.find_element(By.TAG_NAME, "form")
-                    return False, "Form submission blocked by validation"
-                except NoSuchElementException:
-                    # Form no longer exists, probably submitted
+            with timer.phase('detect'):
+                # Check if redirected or URL changed
+                new_url = driver.current_url
+                if new_url != current_url:
                     return True, "Form submitted successfully"
+                else:
+                    # Check for any validation messages or if form is still visible
+                    try:
+                        # Check if form still exists (validation failed)
+                        driver.find_element(By.TAG_NAME, "form")
+                        return False, "Form submission blocked by validation"
+                    except NoSuchElementException:
+                        # Form no longer exists, probably submitted
+                        return True, "Form submitted successfully"
                     
         except TimeoutException:
-            return False, "Submit button not clickable"
+            return None, "Submit button not clickable"
         except Exception as e:
-            return False, f"Error: {str(e)}"
+            return None, f"Error: {str(e)}"
+    
+    def wait_for_submit_settle(self, old_url, driver=None):
+        """Wait until the page navigates or the browser blocks the form as invalid"""
+        driver = driver or self.driver
+        
+        def settled(driver):
+            if driver.current_url != old_url:
+                return True
+            return driver.execute_script(
+                "return document.querySelector('form:invalid') !== null;"
+            )
+
+        try:
+            # The page may be unloading mid-poll after a navigating submit
+            WebDriverWait(
+                driver, SUBMIT_SETTLE_TIMEOUT, poll_frequency=0.05,
+                ignored_exceptions=(WebDriverException,)
+            ).until(settled)
+        except TimeoutException:
+            pass
     
     def get_default_values(self):
         """Get default valid values for all enabled fields"""
@@ -341,74 +687,356 @@ class FormValidationTester:
             
         return defaults
     
-    def test_field(self, field_name, test_data_array, default_values):
-        """Test a specific field with various inputs"""
-        if not FIELDS_TO_TEST.get(field_name, False):
-            print(f"\n⊘ Skipping {field_name.upper()} field (disabled in configuration)")
-            self.skipped_fields.append(field_name)
+    def build_test_values(self, field_name, test_value, default_values):
+        """Form values for testing test_value on field_name"""
+        # Update the field being tested
+        test_values = default_values.copy()
+        test_values[field_name] = test_value
+        
+        # Special handling for confirm_password
+        if field_name == 'confirm_password':
+            # Ensure password field has the value we're comparing against
+            test_values['password'] = STRONG_PASSWORD
+        
+        return test_values
+    
+    def extract_constraints(self, driver=None):
+        """Read the HTML5 constraints of every enabled single-input field in one call"""
+        driver = driver or self.driver
+        self.navigate_to_form(driver)
+        
+        field_ids = {
+            field_name: field_id for field_name, field_id in FIELD_IDS.items()
+            if isinstance(field_id, str) and FIELDS_TO_TEST.get(field_name, False)
+        }
+        
+        return driver.execute_script(f"""
+            const readConstraints = {CONSTRAINTS_SCRIPT};
+            const constraints = {{}};
+            for (const [name, id] of Object.entries(arguments[0])) {{
+                const el = document.getElementById(id);
+                if (el) {{
+                    constraints[name] = readConstraints(el);
+                }}
+            }}
+            return constraints;
+        """, field_ids)
+    
+    def case_values(self, case, default_values):
+        """Form values for a (field_name, test_value[, values]) case"""
+        if len(case) > 2:
+            return case[2]
+        return self.build_test_values(case[0], case[1], default_values)
+    
+    def run_case(self, driver, field_name, test_value, default_values, test_values=None):
+        """
+        Run a single test case on the given driver and return (success, message, timings).
+        success is None when the driver failed before a verdict; such outcomes are reported
+        as rejected but never cached.
+        """
+        timer = PhaseTimer()
+        
+        with timer.phase('navigate'):
+            self.navigate_to_form(driver)
+        
+        if test_values is None:
+            test_values = self.build_test_values(field_name, test_value, default_values)
+        
+        # Fill form
+        with timer.phase('fill'):
+            self.fill_form(driver, **test_values)
+        
+        # Submit and check
+        success, message = self.submit_form(driver, timer)
+        return success, message, timer.finish()
+    
+    def run_cases(self, cases, default_values):
+        """Shard (field_name, test_value[, values]) cases across the driver pool, yielding outcomes in case order"""
+        outcomes = [None] * len(cases)
+        predictions = [None] * len(cases)
+        to_run = list(range(len(cases)))
+        
+        # Cases the browser would block client-side are answered locally
+        if PREVALIDATION:
+            if self.prevalidator is None:
+                self.prevalidator = PreValidator(
+                    self.extract_constraints(), PREVALIDATION_CONFIRM_RATE, typed=FILL_MODE == 'keys'
+                )
+            to_run = []
+            for i, case in enumerate(cases):
+                predictions[i] = self.prevalidator.predict(self.case_values(case, default_values))
+                if predictions[i] and not self.prevalidator.should_confirm():
+                    predicted_field, reason = predictions[i]
+                    outcomes[i] = (False, f"{PREDICTED_BLOCK} {predicted_field} ({reason})", {})
+                else:
+                    to_run.append(i)
+        
+        browser_outcomes = self.run_on_pool([cases[i] for i in to_run], default_values)
+        
+        for i in range(len(cases)):
+            if outcomes[i] is not None:
+                yield outcomes[i]
+                continue
+            
+            success, message, timings = next(browser_outcomes)
+            if predictions[i] and success:
+                predicted_field, reason = predictions[i]
+                message += f" (predicted {reason} on {predicted_field} NOT confirmed)"
+            yield success, message, timings
+    
+    def is_batchable(self, field_name):
+        """Whether a field's cases can share one page in batched inline mode"""
+        return (
+            BATCH_INLINE_MODE and
+            field_name in INLINE_VALIDATION_FIELDS and
+            isinstance(FIELD_IDS.get(field_name), str)
+        )
+    
+    def read_form_structure(self, driver=None):
+        """Structural description of the form used as the result-cache fingerprint"""
+        driver = driver or self.driver
+        self.navigate_to_form(driver)
+        
+        return {
+            'url': WEBSITE_URL,
+            'elements': driver.execute_script("""
+                return Array.from(document.querySelectorAll('form, input, select, textarea, button')).map(el => ({
+                    tag: el.tagName,
+                    type: el.type || '',
+                    id: el.id || '',
+                    name: el.name || '',
+                    required: !!el.required,
+                    pattern: el.getAttribute('pattern'),
+                    min: el.getAttribute('min'),
+                    max: el.getAttribute('max'),
+                    maxlength: el.getAttribute('maxlength'),
+                    action: el.getAttribute('action'),
+                    text: el.tagName === 'BUTTON' ? el.innerText.trim() : ''
+                }));
+            """)
+        }
+    
+    def run_cached(self, cases, default_values):
+        """Run (field_name, test_value, description, should_pass[, values]) cases, reusing cached verdicts"""
+        if not RESULT_CACHE:
+            yield from self.run_cases([(c[0], c[1]) + tuple(c[4:]) for c in cases], default_values)
             return
         
-        print(f"\n{'='*60}")
-        print(f"Testing {field_name.upper()} Field")
-        print(f"{'='*60}")
+        if self.result_cache is None:
+            self.result_cache = ResultCache(RESULT_CACHE_PATH, RESULT_CACHE_TTL_HOURS, RESULT_CACHE_VERIFY_RATE)
+            self.form_fingerprint = form_fingerprint(self.read_form_structure())
+        
+        outcomes = [None] * len(cases)
+        to_run = []
+        for i, (field_name, test_value, _, should_pass, *_) in enumerate(cases):
+            cached = self.result_cache.get(self.form_fingerprint, field_name, test_value, should_pass)
+            if cached is None:
+                to_run.append(i)
+            else:
+                success, message = cached
+                outcomes[i] = (success, f"Cached: {message}", {})
+        
+        fresh = self.run_cases([(cases[i][0], cases[i][1]) + tuple(cases[i][4:]) for i in to_run], default_values)
         
-        for test_value, test_description, should_pass in test_data_array:
-            self.total_tests += 1
-            self.navigate_to_form()
+        for i in range(len(cases)):
+            if outcomes[i] is not None:
+                yield outcomes[i]
+                continue
             
-            # Update the field being tested
-            test_values = default_values.copy()
-            test_values[field_name] = test_value
+            success, message, timings = next(fresh)
+            field_name, test_value, _, should_pass = cases[i][:4]
+            # Only verdicts reached in the browser are cached
+            if success is not None and not message.startswith(PREDICTED_BLOCK):
+                self.result_cache.put(self.form_fingerprint, field_name, test_value, should_pass, success, message)
+            yield success, message, timings
+    
+    def run_on_pool(self, cases, default_values):
+        """
+        Run (field_name, test_value[, values]) cases on the driver pool, yielding each
+        outcome as soon as it and every case before it have finished
+        """
+        # Consecutive cases of a batchable field form one job on one driver
+        jobs = []
+        for case in cases:
+            field_name = case[0]
+            if jobs and jobs[-1][0] == field_name and self.is_batchable(field_name):
+                jobs[-1][1].append(case)
+            else:
+                jobs.append((field_name, [case]))
+        
+        free_drivers = queue.Queue()
+        for driver in self.drivers:
+            free_drivers.put(driver)
+        
+        def run_job(job):
+            field_name, job_cases = job
+            driver = free_drivers.get()
+            try:
+                if self.is_batchable(field_name):
+                    test_values = [case[1] for case in job_cases]
+                    return self.run_inline_batch(driver, field_name, test_values, default_values)
+                return [self.run_case(driver, case[0], case[1], default_values, *case[2:]) for case in job_cases]
+            finally:
+                free_drivers.put(driver)
+        
+        executor = ThreadPoolExecutor(max_workers=len(self.drivers))
+        try:
+            for outcomes in executor.map(run_job, jobs):
+                yield from outcomes
+        finally:
+            # A consumer that stops early (crash, interrupt) does not wait for queued jobs
+            executor.shutdown(cancel_futures=True)
+    
+    def run_inline_batch(self, driver, field_name, test_values, default_values):
+        """Type each test value into one loaded form, reading the inline error state after each"""
+        outcomes = []
+        needs_load = True
+        
+        for test_value in test_values:
+            timer = PhaseTimer()
             
-            # Special handling for confirm_password
-            if field_name == 'confirm_password':
-                # Ensure password field has the value we're comparing against
-                test_values['password'] = STRONG_PASSWORD
+            if needs_load:
+                with timer.phase('navigate'):
+                    self.navigate_to_form(driver)
+                with timer.phase('fill'):
+                    self.fill_form(driver, **self.build_test_values(field_name, test_value, default_values))
+                needs_load = False
+            else:
+                with timer.phase('fill'):
+                    self.fill_field(field_name, test_value, driver)
             
-            # Fill form
-            self.fill_form(**test_values)
+            with timer.phase('detect'):
+                inline_error = self.read_inline_error(driver, FIELD_IDS[field_name])
             
-            # Submit and check
-            success, message = self.submit_form()
+            if inline_error:
+                outcomes.append((False, f"Inline validation error: {inline_error}", timer.finish()))
+                continue
             
-            # Determine test result
-            if should_pass and success:
-                result = "PASS ✓"
-                self.passed_tests += 1
-                status = "Expected: VALID | Actual: ACCEPTED"
-            elif not should_pass and not success:
-                result = "PASS ✓"
-                self.passed_tests += 1
-                status = "Expected: INVALID | Actual: REJECTED"
-            elif should_pass and not success:
-                result = "FAIL ✗"
-                self.failed_tests += 1
-                status = "Expected: VALID | Actual: REJECTED (False Negative)"
-            else:
-                result = "FAIL ✗"
-                self.failed_tests += 1
-                status = "Expected: INVALID | Actual: ACCEPTED (Vulnerability!)"
-                self.vulnerabilities.append({
-                    'field': field_name,
-                    'input': test_value,
-                    'description': test_description
-                })
+            form_url = driver.current_url
+            success, message = self.submit_form(driver, timer)
+            outcomes.append((success, message, timer.finish()))
+            
+            # Only a submitted form leaves the page in an unknown state
+            needs_load = success or driver.current_url != form_url
+        
+        return outcomes
+    
+    def read_inline_error(self, driver, field_id):
+        """Blur a field and return its inline validation message, or None"""
+        script = """
+            const el = document.getElementById(arguments[0]);
+            if (!el) {
+                return null;
+            }
+            if (arguments[2]) {
+                el.dispatchEvent(new Event('change', { bubbles: true }));
+                el.blur();
+            }
             
-            # Log result
-            test_result = {
-                'field': field_name,
-                'test': test_description,
-                'input': test_value if test_value else "[EMPTY]",
-                'expected': "VALID" if should_pass else "INVALID",
-                'actual': "ACCEPTED" if success else "REJECTED",
-                'result': result,
-                'status': status
+            if (el.validity && !el.validity.valid) {
+                return el.validationMessage || 'invalid';
             }
-            self.test_results.append(test_result)
             
-            print(f"{result} | {field_name}: {test_description}")
-            print(f"     Input: {test_value if test_value else '[EMPTY]'}")
-            print(f"     {status}")
+            // Only messages that belong to this field: its aria-describedby
+            // targets, the siblings up to the next control, and a wrapper
+            // holding no other control (never the form itself)
+            const selectors = arguments[1];
+            const CONTROLS = 'input:not([type=hidden]), select, textarea';
+            const shownText = (candidate) => {
+                const rect = candidate.getBoundingClientRect();
+                const text = (candidate.innerText || '').trim();
+                return text && rect.width > 0 && rect.height > 0 ? text : null;
+            };
+            const matching = (root) => [
+                ...(root.matches(selectors) ? [root] : []),
+                ...root.querySelectorAll(selectors)
+            ];
+            
+            const candidates = [];
+            for (const id of (el.getAttribute('aria-describedby') || '').split(/\s+/)) {
+                const described = id && document.getElementById(id);
+                if (described) {
+                    candidates.push(...matching(described));
+                }
+            }
+            for (let sibling = el.nextElementSibling; sibling; sibling = sibling.nextElementSibling) {
+                if (sibling.matches(CONTROLS) || sibling.querySelector(CONTROLS)) {
+                    break;
+                }
+                candidates.push(...matching(sibling));
+            }
+            const container = el.closest('.form-group, .field, fieldset') || el.parentElement;
+            if (container && container.tagName !== 'FORM' && container !== el.form) {
+                const others = Array.from(container.querySelectorAll(CONTROLS))
+                    .filter(other => other !== el && (!el.name || other.name !== el.name));
+                if (others.length === 0) {
+                    candidates.push(...container.querySelectorAll(selectors));
+                }
+            }
+            
+            for (const candidate of candidates) {
+                const text = shownText(candidate);
+                if (text) {
+                    return text;
+                }
+            }
+            
+            if (el.getAttribute('aria-invalid') === 'true') {
+                return 'aria-invalid';
+            }
+            return null;
+        """
+        selectors = ', '.join(INLINE_ERROR_SELECTORS)
+        
+        inline_error = driver.execute_script(script, field_id, selectors, True)
+        if inline_error:
+            return inline_error
+        
+        # Frameworks often validate asynchronously after blur
+        try:
+            return WebDriverWait(driver, INLINE_ERROR_TIMEOUT, poll_frequency=0.05).until(
+                lambda d: d.execute_script(script, field_id, selectors, False)
+            )
+        except TimeoutException:
+            return None
+    
+    def print_field_header(self, field_name):
+        """Print the banner shown before a field's results"""
+        print(f"\n{'='*60}")
+        print(f"Testing {field_name.upper()} Field")
+        print(f"{'='*60}")
+    
+    def record_result(self, field_name, test_value, test_description, should_pass, success, message=None, timings=None):
+        """Stream a finished test case into the report pipeline"""
+        # Determine test result
+        if should_pass and success:
+            status = "Expected: VALID | Actual: ACCEPTED"
+        elif not should_pass and not success:
+            status = "Expected: INVALID | Actual: REJECTED"
+        elif should_pass and not success:
+            status = "Expected: VALID | Actual: REJECTED (False Negative)"
+        else:
+            status = "Expected: INVALID | Actual: ACCEPTED (Vulnerability!)"
+        
+        passed = should_pass == bool(success)
+        result = "PASS ✓" if passed else "FAIL ✗"
+        
+        self.report.emit({
+            'field': field_name,
+            'test': test_description,
+            'input': test_value,
+            'expected': "VALID" if should_pass else "INVALID",
+            'actual': "ACCEPTED" if success else "REJECTED",
+            'result': result,
+            'passed': passed,
+            'status': status,
+            'reason': message,
+            'timings': timings or {}
+        })
+        
+        print(f"{result} | {field_name}: {test_description}")
+        print(f"     Input: {test_value if test_value else '[EMPTY]'}")
+        print(f"     {status}")
     
     def run_all_tests(self):
         """Run all field validation tests"""
@@ -421,179 +1049,101 @@ class FormValidationTester:
             status = "✓ ENABLED" if enabled else "✗ DISABLED"
             print(f"{field.upper()}: {status}")
         
-        # Test each field based on configuration
-        if FIELDS_TO_TEST.get('name', False):
-            self.test_field('name', NAME_TESTS, default_values)
+        field_tests = [
+            ('name', NAME_TESTS),
+            ('age', AGE_TESTS),
+            ('email', EMAIL_TESTS),
+            ('password', PASSWORD_TESTS),
+            ('confirm_password', CONFIRM_PASSWORD_TESTS),
+            ('dob', DOB_TESTS),
+            ('address', ADDRESS_TESTS),
+            ('phone', PHONE_TESTS),
+            ('otp', OTP_TESTS)
+        ]
+        for field_name, _ in field_tests:
+            if not FIELDS_TO_TEST.get(field_name, False):
+                print(f"\n⊘ Skipping {field_name.upper()} field (disabled in configuration)")
+                self.skipped_fields.append(field_name)
+        field_tests = [(f, tests) for f, tests in field_tests if FIELDS_TO_TEST.get(f, False)]
         
-        if FIELDS_TO_TEST.get('age', False):
-            self.test_field('age', AGE_TESTS, default_values)
+        # Cases are streamed from a generator and sharded across the pool chunk by chunk
+        if MATRIX_MODE == 'single':
+            cases = self.single_field_cases(field_tests)
+        else:
+            cases = self.matrix_cases(field_tests, default_values)
         
-        if FIELDS_TO_TEST.get('email', False):
-            self.test_field('email', EMAIL_TESTS, default_values)
-        
-        if FIELDS_TO_TEST.get('password', False):
-            self.test_field('password', PASSWORD_TESTS, default_values)
-        
-        if FIELDS_TO_TEST.get('confirm_password', False):
-            self.test_field('confirm_password', CONFIRM_PASSWORD_TESTS, default_values)
+        current_field = None
+        while True:
+            chunk = list(islice(cases, CASE_CHUNK_SIZE))
+            if not chunk:
+                break
+            
+            outcomes = self.run_cached(chunk, default_values)
+            
+            # Recorded in case order as each outcome arrives, so a crash mid-chunk
+            # keeps every case finished before it
+            for (field_name, test_value, test_description, should_pass, *_), (success, message, timings) in zip(chunk, outcomes):
+                if field_name != current_field:
+                    current_field = field_name
+                    self.print_field_header(field_name)
+                self.record_result(field_name, test_value, test_description, should_pass, success, message, timings)
         
-        if FIELDS_TO_TEST.get('dob', False):
-            self.test_field('dob', DOB_TESTS, default_values)
+        print(f"\n{'='*60}")
+        print("TIMING SUMMARY (ms)")
+        print(f"{'='*60}")
+        print(self.report.aggregate.timings.summary())
+    
+    def single_field_cases(self, field_tests):
+        """Yield (field_name, test_value, description, should_pass) one field at a time"""
+        for field_name, test_data_array in field_tests:
+            for test_value, test_description, should_pass in test_data_array:
+                yield field_name, test_value, test_description, should_pass
+    
+    def matrix_cases(self, field_tests, default_values):
+        """Yield pairwise/n-wise combinations as (mode, input, description, should_pass, values)"""
+        parameters = dict(field_tests)
         
-        if FIELDS_TO_TEST.get('address', False):
-            self.test_field('address', ADDRESS_TESTS, default_values)
+        def filled_values(row):
+            values = default_values.copy()
+            values.update({field_name: test[0] for field_name, test in row.items()})
+            return values
         
-        if FIELDS_TO_TEST.get('phone', False):
-            self.test_field('phone', PHONE_TESTS, default_values)
+        # Rows filling the same values are one case, whatever their descriptions
+        same_values = lambda row: tuple(sorted(filled_values(row).items()))
         
-        if FIELDS_TO_TEST.get('otp', False):
-            self.test_field('otp', OTP_TESTS, default_values)
-    
-    def generate_report(self):
-        """Generate detailed test report"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        report_filename = f"form_validation_report_{timestamp}.txt"
-        
-        with open(report_filename, 'w', encoding='utf-8') as f:
-            # Header
-            f.write("="*80 + "\n")
-            f.write("FORM VALIDATION TEST REPORT\n")
-            f.write("="*80 + "\n")
-            f.write(f"Website URL: {WEBSITE_URL}\n")
-            f.write(f"Test Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"Total Tests: {self.total_tests}\n")
-            f.write(f"Passed: {self.passed_tests} ({(self.passed_tests/self.total_tests*100):.2f}%)\n")
-            f.write(f"Failed: {self.failed_tests} ({(self.failed_tests/self.total_tests*100):.2f}%)\n")
-            
-            # Fields tested
-            f.write("\nFields Tested:\n")
-            for field, enabled in FIELDS_TO_TEST.items():
-                if enabled:
-                    f.write(f"  ✓ {field.upper()}\n")
-            
-            if self.skipped_fields:
-                f.write("\nFields Skipped:\n")
-                for field in self.skipped_fields:
-                    f.write(f"  ✗ {field.upper()}\n")
-            
-            f.write("="*80 + "\n\n")
-            
-            # Executive Summary
-            f.write("EXECUTIVE SUMMARY\n")
-            f.write("-"*80 + "\n")
-            if len(self.vulnerabilities) == 0:
-                f.write("✓ No critical vulnerabilities found. All validations working correctly.\n")
-            else:
-                f.write(f"✗ CRITICAL: {len(self.vulnerabilities)} vulnerabilities found!\n")
-                f.write("  The form accepts invalid data for the following fields:\n")
-                for vuln in self.vulnerabilities:
-                    f.write(f"  - {vuln['field'].upper()}: {vuln['description']}\n")
-            f.write("\n")
-            
-            # Detailed Test Results
-            f.write("DETAILED TEST RESULTS\n")
-            f.write("-"*80 + "\n\n")
-            
-            current_field = None
-            for result in self.test_results:
-                if current_field != result['field']:
-                    current_field = result['field']
-                    f.write(f"\n{current_field.upper()} FIELD TESTS\n")
-                    f.write("-"*80 + "\n")
-                
-                f.write(f"\n{result['result']} | Test: {result['test']}\n")
-                f.write(f"   Input: {result['input']}\n")
-                f.write(f"   Expected: {result['expected']} | Actual: {result['actual']}\n")
-                f.write(f"   Status: {result['status']}\n")
-            
-            # Vulnerabilities Section
-            f.write("\n" + "="*80 + "\n")
-            f.write("SECURITY VULNERABILITIES\n")
-            f.write("="*80 + "\n")
-            if len(self.vulnerabilities) > 0:
-                for i, vuln in enumerate(self.vulnerabilities, 1):
-                    f.write(f"\nVulnerability #{i}:\n")
-                    f.write(f"  Field: {vuln['field'].upper()}\n")
-                    f.write(f"  Issue: {vuln['description']}\n")
-                    f.write(f"  Invalid Input Accepted: {vuln['input']}\n")
-            else:
-                f.write("\n✓ No vulnerabilities detected.\n")
-            
-            # Recommendations
-            f.write("\n" + "="*80 + "\n")
-            f.write("RECOMMENDATIONS\n")
-            f.write("="*80 + "\n")
+        for row in matrix_rows(parameters, MATRIX_MODE, MATRIX_STRENGTH, key=same_values):
+            values = filled_values(row)
             
-            recommendations = []
-            
-            for vuln in self.vulnerabilities:
-                if vuln['field'] == 'name':
-                    if 'Alphanumeric' in vuln['description']:
-                        recommendations.append("- NAME: Add validation to reject numeric characters")
-                    if 'Special Characters' in vuln['description']:
-                        recommendations.append("- NAME: Add validation to reject special characters")
-                    if 'Empty' in vuln['description']:
-                        recommendations.append("- NAME: Make field required (cannot be empty)")
-                
-                elif vuln['field'] == 'age':
-                    if 'Underage' in vuln['description']:
-                        recommendations.append("- AGE: Implement minimum age requirement (18+)")
-                    if 'Invalid' in vuln['description'] or 'Negative' in vuln['description']:
-                        recommendations.append("- AGE: Add range validation (18-120)")
-                    if 'Alphabetic' in vuln['description']:
-                        recommendations.append("- AGE: Restrict input to numeric values only")
-                
-                elif vuln['field'] == 'email':
-                    recommendations.append("- EMAIL: Implement proper email format validation (RFC 5322)")
-                
-                elif vuln['field'] == 'password':
-                    if 'Short' in vuln['description']:
-                        recommendations.append("- PASSWORD: Enforce minimum length (8+ characters)")
-                    if 'Weak' in vuln['description']:
-                        recommendations.append("- PASSWORD: Require strong password (uppercase, lowercase, numbers, special chars)")
-                
-                elif vuln['field'] == 'confirm_password':
-                    recommendations.append("- CONFIRM PASSWORD: Ensure password fields match before submission")
-                
-                elif vuln['field'] == 'phone':
-                    if 'Alphanumeric' in vuln['description']:
-                        recommendations.append("- PHONE: Restrict to numeric values only")
-                    if 'Short' in vuln['description'] or 'Long' in vuln['description']:
-                        recommendations.append("- PHONE: Enforce exact length (10 digits)")
-                
-                elif vuln['field'] == 'dob':
-                    if 'Future' in vuln['description']:
-                        recommendations.append("- DOB: Validate date is not in the future")
-                    if 'Underage' in vuln['description']:
-                        recommendations.append("- DOB: Ensure user is at least 18 years old")
-                    if 'Format' in vuln['description']:
-                        recommendations.append("- DOB: Use proper date picker (YYYY-MM-DD)")
-                
-                elif vuln['field'] == 'otp':
-                    if 'Short' in vuln['description'] or 'Long' in vuln['description']:
-                        recommendations.append("- OTP: Enforce exactly 6 digits")
-                    if 'Alphabetic' in vuln['description'] or 'Alphanumeric' in vuln['description']:
-                        recommendations.append("- OTP: Accept only numeric values")
-            
-            if recommendations:
-                for rec in set(recommendations):
-                    f.write(f"{rec}\n")
-            else:
-                f.write("✓ Form validation is working correctly. No improvements needed.\n")
+            should_pass = all(
+                test[2] for field_name, test in row.items() if field_name != 'confirm_password'
+            )
+            # Confirmation is valid when it matches the password actually used
+            if 'confirm_password' in row:
+                confirm_value = row['confirm_password'][0]
+                should_pass = should_pass and confirm_value != "" and confirm_value == values.get('password')
             
-            f.write("\n" + "="*80 + "\n")
-            f.write("END OF REPORT\n")
-            f.write("="*80 + "\n")
+            test_input = "; ".join(f"{field_name}={test[0]!r}" for field_name, test in row.items())
+            test_description = " + ".join(test[1] for test in row.values())
+            yield MATRIX_MODE, test_input, test_description, should_pass, values
+    
+    def generate_report(self):
+        """Finish every report file with its summary sections and return the main report path"""
+        self.report.close()
         
         print(f"\n\n{'='*60}")
-        print(f"Report generated: {report_filename}")
+        for path in self.report.paths:
+            print(f"Report generated: {path}")
         print(f"{'='*60}")
         
-        return report_filename
+        return self.report.paths[0] if self.report.paths else None
     
     def close(self):
-        """Close the browser"""
-        self.driver.quit()
+        """Close all browsers in the pool and finish the reports (also after a partial run)"""
+        for driver in self.drivers:
+            driver.quit()
+        self.report.close()
+        if self.result_cache:
+            self.result_cache.close()
 
 # ===============================
 # MAIN EXECUTION
@@ -1,10 +1,30 @@
 import asyncio
+import atexit
+import contextvars
+import copy
+import fnmatch
+import functools
+import glob
+import hashlib
+import json
+import os
 import re
+import time
 import random
+from collections import deque
+from collections.abc import MutableMapping
 import string
 from datetime import datetime
+from detection_rules import CompiledRules, load_rules
+from launch_profiles import resolve_launch_profile
 from playwright.async_api import async_playwright, TimeoutError
-from urllib.parse import urlparse
+from urllib.parse import parse_qsl, urljoin, urlparse
+from matrix import matrix_rows
+from page_scripts import INTERACTABILITY_JS
+from prevalidation import CONSTRAINTS_SCRIPT, PreValidator
+from result_cache import ResultCache, form_fingerprint
+from results_sink import ResultsSink
+from timing import PhaseTimer, summarize_timings
 
 
 # ===============================
@@ -22,163 +42,650 @@ def generate_unique_email():
 
 
 #--------------------------------
-# FORM SIGNATURE GENERATOR 
+# FORM SNAPSHOT (SINGLE DOM WALK)
 #--------------------------------
 
-async def get_form_signature(page):
-    """
-    Creates a robust, interaction-based signature of the active form step.
-    Enhanced to detect differences between email and OTP input forms.
-    Works even when all steps exist in DOM but visibility changes.
-    """
-    return await page.evaluate("""
-        () => {
-            const isInteractable = (el) => {
-                const s = window.getComputedStyle(el);
-                const rect = el.getBoundingClientRect();
-
-                return (
-                    s.display !== 'none' &&
-                    s.visibility !== 'hidden' &&
-                    s.opacity !== '0' &&
-                    !el.disabled &&
-                    rect.width > 0 &&
-                    rect.height > 0 &&
-                    el.tabIndex !== -1 &&
-                    !el.hasAttribute('aria-hidden')
-                );
-            };
+# Collects the form signature, the first inline validation error and the
+# visibility of every configured success/error selector in one pass over the
+# DOM, so each check costs a single evaluate round-trip. Inline error texts
+# are matched in the page against the compiled rule pattern, so only the
+# match crosses the wire. Selectors must be plain CSS.
+FORM_SNAPSHOT_SCRIPT = """
+    ({ successSelectors, errorSelectors, submitSelector, inlineErrorPattern, inlineErrorSelectors }) => {
+        const SIGNATURE_TEXT_TAGS = new Set(['H1', 'H2', 'H3', 'H4', 'H5', 'H6', 'LABEL', 'P', 'SPAN', 'DIV']);
+        const INLINE_TEXT_TAGS = new Set(['P', 'SPAN', 'DIV', 'SMALL', 'LABEL']);
+        const FIELD_TAGS = new Set(['INPUT', 'SELECT', 'TEXTAREA']);
+        const CONTAINER_HINTS = ['form', 'step'];
+""" + INTERACTABILITY_JS + """
+        const isContainer = (el) => {
+            const id = el.id || '';
+            const cls = el.getAttribute('class') || '';
+            return CONTAINER_HINTS.some(h => id.includes(h) || cls.includes(h));
+        };
+
+        const activeInputs = [];
+        const buttonTexts = [];
+        const visibleTexts = [];
+        const seenTexts = new Set();
+        // Patterns are checked when the rules load; a bad one must still not break every snapshot
+        let inlinePattern = null;
+        try {
+            inlinePattern = inlineErrorPattern ? new RegExp(inlineErrorPattern, 'i') : null;
+        } catch (e) {}
+        let inlineError = null;
+        const containerIds = [];
+
+        for (const el of document.getElementsByTagName('*')) {
+            const tag = el.tagName;
+            const isField = FIELD_TAGS.has(tag);
+            const isButton = tag === 'BUTTON';
+            const wantsSignatureText = SIGNATURE_TEXT_TAGS.has(tag);
+            const wantsInlineText = INLINE_TEXT_TAGS.has(tag);
+            const container = containerIds.length < 5 && isContainer(el);
+
+            if (!isField && !isButton && !wantsSignatureText && !wantsInlineText && !container) {
+                continue;
+            }
+
+            const s = window.getComputedStyle(el);
+            const rect = el.getBoundingClientRect();
+
+            if (isField && el.type !== 'hidden' && isInteractable(el, s, rect)) {
+                activeInputs.push({
+                    tag: el.tagName,
+                    type: el.type || '',
+                    name: el.name || '',
+                    id: el.id || '',
+                    placeholder: el.placeholder || '',
+                    maxlength: el.maxLength || null,
+                    pattern: el.pattern || '',
+                    inputmode: el.getAttribute('inputmode') || '',
+                    autocomplete: el.autocomplete || '',
+                    className: el.className || ''
+                });
+            }
+
+            if (isButton && isInteractable(el, s, rect)) {
+                buttonTexts.push(el.innerText.trim().toLowerCase());
+            }
+
+            if (container && isInteractable(el, s, rect)) {
+                containerIds.push(el.id || el.className);
+            }
+
+            if (!wantsSignatureText && !wantsInlineText) {
+                continue;
+            }
+
+            if (s.display === 'none' || s.visibility === 'hidden') {
+                continue;
+            }
+
+            const text = (el.innerText || '').trim();
+            if (!text) {
+                continue;
+            }
+            const lowered = text.toLowerCase();
+
+            if (wantsInlineText && inlineError === null && inlinePattern && inlinePattern.test(lowered)) {
+                inlineError = lowered;
+            }
+
+            if (wantsSignatureText && isShown(s, rect) && text.length < 200 && !seenTexts.has(lowered)) {
+                seenTexts.add(lowered);
+                visibleTexts.push(lowered);
+            }
+        }
 
-            const inputs = Array.from(
-                document.querySelectorAll('input, select, textarea')
-            ).filter(el => 
-                el.type !== 'hidden' && isInteractable(el)
-            );
+        const anyVisible = (selectors) => selectors.some(selector => {
+            try {
+                return Array.from(document.querySelectorAll(selector)).some(el => {
+                    const rect = el.getBoundingClientRect();
+                    return rect.width > 0 &&
+                           rect.height > 0 &&
+                           window.getComputedStyle(el).visibility !== 'hidden';
+                });
+            } catch (e) {
+                return false;
+            }
+        });
+
+        // Elements matched by an inline error selector count whatever they say
+        for (const selector of inlineErrorSelectors) {
+            if (inlineError !== null) {
+                break;
+            }
+            try {
+                for (const el of document.querySelectorAll(selector)) {
+                    const rect = el.getBoundingClientRect();
+                    const text = (el.innerText || '').trim();
+                    if (text && rect.width > 0 && rect.height > 0) {
+                        inlineError = text.toLowerCase();
+                        break;
+                    }
+                }
+            } catch (e) {}
+        }
 
-            const buttons = Array.from(
-                document.querySelectorAll('button')
-            ).filter(isInteractable);
+        let submitEnabled = null;
+        try {
+            const submit = document.querySelector(submitSelector);
+            if (submit) {
+                submitEnabled = !submit.disabled;
+            }
+        } catch (e) {}
 
-            // Collect all visible text content (headings, labels, paragraphs)
-            const visibleTexts = Array.from(
-                document.querySelectorAll('h1, h2, h3, h4, h5, h6, label, p, span, div')
-            )
-            .filter(el => {
-                const s = window.getComputedStyle(el);
-                const rect = el.getBoundingClientRect();
-                return (
-                    s.display !== 'none' &&
-                    s.visibility !== 'hidden' &&
-                    s.opacity !== '0' &&
-                    rect.width > 0 &&
-                    rect.height > 0 &&
-                    el.innerText &&
-                    el.innerText.trim().length > 0 &&
-                    el.innerText.trim().length < 200 // Avoid capturing large blocks
-                );
-            })
-            .map(el => el.innerText.trim().toLowerCase())
-            .filter((text, index, self) => self.indexOf(text) === index); // Remove duplicates
-
-            // Capture input field details with more precision
-            const activeInputs = inputs.map(el => ({
-                tag: el.tagName,
-                type: el.type || '',
-                name: el.name || '',
-                id: el.id || '',
-                placeholder: el.placeholder || '',
-                maxlength: el.maxLength || null,
-                pattern: el.pattern || '',
-                inputmode: el.getAttribute('inputmode') || '',
-                autocomplete: el.autocomplete || '',
-                className: el.className || ''
-            }));
-
-            // Get button text with better formatting
-            const buttonTexts = buttons.map(b => b.innerText.trim().toLowerCase());
-
-            // Create a composite hash from all visible text
-            const textHash = visibleTexts.join('|').substring(0, 500);
-
-            return {
+        return {
+            signature: {
                 active_input_count: activeInputs.length,
                 active_inputs: activeInputs,
                 active_button_texts: buttonTexts,
                 visible_texts: visibleTexts.slice(0, 10), // First 10 unique texts
-                text_hash: textHash,
-                has_otp_indicators: visibleTexts.some(t => 
-                    t.includes('otp') || 
-                    t.includes('verify') || 
+                text_hash: visibleTexts.join('|').substring(0, 500),
+                has_otp_indicators: visibleTexts.some(t =>
+                    t.includes('otp') ||
+                    t.includes('verify') ||
                     t.includes('code') ||
                     t.includes('6-digit') ||
                     t.includes('enter 6')
                 ),
-                has_email_indicators: visibleTexts.some(t => 
-                    t.includes('email') || 
+                has_email_indicators: visibleTexts.some(t =>
+                    t.includes('email') ||
                     t.includes('welcome') ||
                     t.includes('detect if')
                 ),
-                form_container_ids: Array.from(
-                    document.querySelectorAll('[id*="form"], [class*="form"], [id*="step"], [class*="step"]')
-                )
-                .filter(isInteractable)
-                .map(el => el.id || el.className)
-                .slice(0, 5)
-            };
+                form_container_ids: containerIds
+            },
+            inline_error: inlineError,
+            success_visible: anyVisible(successSelectors),
+            error_visible: anyVisible(errorSelectors),
+            submit_enabled: submitEnabled
+        };
+    }
+"""
+
+
+async def get_form_snapshot(page):
+    """
+    Takes a single-round-trip snapshot of the page:
+    form signature, inline texts, selector visibility and submit state.
+    """
+    return await page.evaluate(FORM_SNAPSHOT_SCRIPT, form_snapshot_args())
+
+
+def form_snapshot_args():
+    cfg = CONFIG["success_detection"]
+    rules = detection_rules()
+
+    return {
+        "successSelectors": cfg["success_message_selectors"],
+        "errorSelectors": cfg["error_message_selectors"],
+        "submitSelector": CONFIG["submit_selector"],
+        "inlineErrorPattern": rules.inline_error_source,
+        "inlineErrorSelectors": rules.inline_error_selectors
+    }
+
+
+#--------------------------------
+# FORM SIGNATURE GENERATOR 
+#--------------------------------
+
+async def get_form_signature(page):
+    """
+    Creates a robust, interaction-based signature of the active form step.
+    Enhanced to detect differences between email and OTP input forms.
+    Works even when all steps exist in DOM but visibility changes.
+    """
+    snapshot = await get_form_snapshot(page)
+    return snapshot["signature"]
+
+
+#--------------------------------
+# INCREMENTAL FORM-STATE TRACKING
+#--------------------------------
+
+# Installed with add_init_script so every document gets a persistent
+# MutationObserver. It only reacts to mutations touching inputs/buttons or
+# visible text and keeps a cheap delta the Python side polls with take().
+# Text is compared as end states against the reset() snapshot, so spinners
+# and "Please wait…" labels that come and go do not count as a change.
+FORM_WATCH_SCRIPT = """
+    (() => {
+        if (window.__formWatch) {
+            return;
         }
-    """)
+
+        const CONTROLS = 'input:not([type=hidden]), select, textarea, button';
+        const TEXT_ELEMENTS = 'h1, h2, h3, h4, h5, h6, label, p, span, div, button';
+
+        const isVisible = (el) => {
+            const s = window.getComputedStyle(el);
+            const rect = el.getBoundingClientRect();
+            return s.display !== 'none' &&
+                   s.visibility !== 'hidden' &&
+                   s.opacity !== '0' &&
+                   rect.width > 0 &&
+                   rect.height > 0;
+        };
+
+        const visibleControls = () => new Set(
+            Array.from(document.querySelectorAll(CONTROLS))
+                .filter(el => !el.disabled && isVisible(el))
+        );
+
+        const visibleTexts = () => {
+            const texts = new Set();
+            for (const el of document.querySelectorAll(TEXT_ELEMENTS)) {
+                const raw = el.textContent.trim();
+                if (raw && raw.length < 200 && isVisible(el)) {
+                    texts.add((el.innerText || raw).trim().toLowerCase());
+                }
+            }
+            texts.delete('');
+            return texts;
+        };
+
+        const touchesControls = (node) => (
+            node.nodeType === Node.ELEMENT_NODE &&
+            (node.matches(CONTROLS) || node.querySelector(CONTROLS) !== null)
+        );
+
+        const hasVisibleText = (node) => {
+            const el = node.nodeType === Node.TEXT_NODE ? node.parentElement : node;
+            return !!el &&
+                   el.nodeType === Node.ELEMENT_NODE &&
+                   node.textContent.trim().length > 0 &&
+                   isVisible(el);
+        };
+
+        const emptyDelta = () => ({
+            inputs_shown: 0,
+            inputs_hidden: 0,
+            buttons_shown: 0,
+            buttons_hidden: 0,
+            text_changed: 0
+        });
+
+        const watch = window.__formWatch = {
+            token: Math.random().toString(36).slice(2),
+            dirty: 0,
+            delta: emptyDelta(),
+            controls: null,
+            texts: null,
+            textTouched: false,
+
+            reset() {
+                this.dirty = 0;
+                this.delta = emptyDelta();
+                this.controls = visibleControls();
+                this.texts = visibleTexts();
+                this.textTouched = false;
+                return this.token;
+            },
+
+            take(token) {
+                if (this.textTouched) {
+                    this.delta.text_changed = diffTexts();
+                }
+                const result = Object.assign(
+                    { dirty: this.dirty, document_replaced: token !== this.token },
+                    this.delta
+                );
+                this.reset();
+                return result;
+            }
+        };
+
+        const diffControls = () => {
+            const before = watch.controls || new Set();
+            const after = visibleControls();
+            let changed = 0;
+
+            for (const el of after) {
+                if (!before.has(el)) {
+                    watch.delta[el.tagName === 'BUTTON' ? 'buttons_shown' : 'inputs_shown']++;
+                    changed++;
+                }
+            }
+            for (const el of before) {
+                if (!after.has(el)) {
+                    watch.delta[el.tagName === 'BUTTON' ? 'buttons_hidden' : 'inputs_hidden']++;
+                    changed++;
+                }
+            }
+
+            watch.controls = after;
+            return changed;
+        };
+
+        const diffTexts = () => {
+            const before = watch.texts || new Set();
+            const after = visibleTexts();
+            let changed = 0;
+
+            for (const text of after) {
+                if (!before.has(text)) {
+                    changed++;
+                }
+            }
+            for (const text of before) {
+                if (!after.has(text)) {
+                    changed++;
+                }
+            }
+            return changed;
+        };
+
+        new MutationObserver((mutations) => {
+            let controlsTouched = false;
+            let textChanges = 0;
+
+            for (const m of mutations) {
+                if (m.type === 'characterData') {
+                    if (hasVisibleText(m.target)) {
+                        textChanges++;
+                    }
+                } else if (m.type === 'attributes') {
+                    if (touchesControls(m.target)) {
+                        controlsTouched = true;
+                    }
+                } else {
+                    for (const node of m.addedNodes) {
+                        if (touchesControls(node)) {
+                            controlsTouched = true;
+                        } else if (hasVisibleText(node)) {
+                            textChanges++;
+                        }
+                    }
+                    for (const node of m.removedNodes) {
+                        if (touchesControls(node)) {
+                            controlsTouched = true;
+                        } else if (node.textContent.trim().length > 0) {
+                            textChanges++;
+                        }
+                    }
+                }
+            }
+
+            const controlChanges = controlsTouched ? diffControls() : 0;
+            if (textChanges) {
+                watch.textTouched = true;
+            }
+
+            if (controlChanges || textChanges) {
+                watch.dirty++;
+            }
+        }).observe(document, {
+            childList: true,
+            subtree: true,
+            characterData: true,
+            attributes: true,
+            attributeFilter: ['style', 'class', 'hidden', 'disabled', 'aria-hidden', 'type']
+        });
+    })();
+"""
+
+FORM_DELTA_KEYS = (
+    "inputs_shown", "inputs_hidden", "buttons_shown", "buttons_hidden", "text_changed"
+)
+
+
+async def start_form_watch(page):
+    """
+    Starts a fresh delta window and captures the form signature in the same
+    round-trip; the signature is what a replaced document is compared with.
+    Returns (token or None, signature).
+    """
+    started = await page.evaluate(
+        f"""(args) => ({{
+            token: window.__formWatch ? window.__formWatch.reset() : null,
+            signature: ({FORM_SNAPSHOT_SCRIPT})(args).signature
+        }})""",
+        form_snapshot_args()
+    )
+    return started["token"], started["signature"]
+
+
+async def take_form_delta(page, token):
+    """
+    Returns the mutations recorded since start_form_watch() and starts a new window
+    """
+    return await page.evaluate(
+        "(token) => window.__formWatch ? window.__formWatch.take(token) : null",
+        token
+    )
 
 
+def form_changed(delta, old_signature=None, new_signature=None):
+    """
+    Decides whether the active form step changed from an incremental delta.
+    A replaced document (e.g. a POST re-rendering the form with a server-side
+    error) only counts when its form signature differs from the pre-submit one.
+    """
+    if delta["document_replaced"]:
+        return old_signature is None or new_signature != old_signature
+
+    return any(delta[key] for key in FORM_DELTA_KEYS)
+
 
 #--------------------------------
 # INLINE VALIDATION ERROR DETECTION 
 #--------------------------------
-async def detect_inline_validation_error(page):
+
+INLINE_ERROR_KEYWORDS = [
+    "valid email",
+    "invalid",
+    "required",
+    "please enter",
+    "not valid",
+    "error"
+]
+
+
+# Compiled rule sets, keyed by everything they are built from
+_COMPILED_RULES = {}
+
+
+def detection_rules():
     """
-    Detects visible inline validation messages on the page
+    The rule set for CONFIG["url"]: INLINE_ERROR_KEYWORDS and the configured
+    success URL keywords, extended by the rules file (see detection_rules.py).
+    Compiled once per target.
     """
-    error_keywords = [
-        "valid email",
-        "invalid",
-        "required",
-        "please enter",
-        "not valid",
-        "error"
-    ]
+    rules_cfg = CONFIG["detection_rules"]
+    base = {
+        "inline_error": {"keywords": INLINE_ERROR_KEYWORDS},
+        "success_url": {"keywords": CONFIG["success_detection"]["success_url_keywords"]}
+    }
+    key = (
+        CONFIG["url"],
+        rules_cfg["path"],
+        tuple(rules_cfg["locales"]),
+        tuple(INLINE_ERROR_KEYWORDS),
+        tuple(base["success_url"]["keywords"])
+    )
+
+    if key not in _COMPILED_RULES:
+        _COMPILED_RULES[key] = CompiledRules(
+            load_rules(base, rules_cfg["path"], CONFIG["url"], rules_cfg["locales"])
+        )
+    return _COMPILED_RULES[key]
 
-    texts = await page.evaluate("""
-        () => {
-            const elements = Array.from(
-                document.querySelectorAll('p, span, div, small, label')
-            ).filter(el => {
-                const style = window.getComputedStyle(el);
-                return style.display !== 'none' &&
-                       style.visibility !== 'hidden' &&
-                       el.innerText.trim().length > 0;
-            });
-
-            return elements.map(el => el.innerText.trim().toLowerCase());
-        }
-    """)
 
-    for text in texts:
-        for keyword in error_keywords:
-            if keyword in text:
-                return True, text
+async def detect_inline_validation_error(page, snapshot=None):
+    """
+    Detects visible inline validation messages on the page
+    """
+    if snapshot is None:
+        snapshot = await get_form_snapshot(page)
 
-    return False, None
+    text = snapshot["inline_error"]
+    return text is not None, text
 
 
 # ===============================
 # CONFIGURATION 
 # ===============================
 
-CONFIG = {
+# The site config of the running task during batch runs (see batch.py)
+_SITE_CONFIG = contextvars.ContextVar("site_config", default=None)
+
+# Keys a site config replaces wholesale instead of merging into the defaults
+REPLACED_CONFIG_KEYS = ("fields",)
+
+
+class ConfigView(MutableMapping):
+    """
+    CONFIG as seen by the running task: the site config activated with
+    use_site_config() inside a batch run, the module defaults otherwise
+    """
+
+    def __init__(self, defaults):
+        self.defaults = defaults
+
+    def _current(self):
+        return _SITE_CONFIG.get() or self.defaults
+
+    def __getitem__(self, key):
+        return self._current()[key]
+
+    def __setitem__(self, key, value):
+        self._current()[key] = value
+
+    def __delitem__(self, key):
+        del self._current()[key]
+
+    def __iter__(self):
+        return iter(self._current())
+
+    def __len__(self):
+        return len(self._current())
+
+
+def merge_config(defaults, overrides):
+    """
+    Deep copy of `defaults` with `overrides` merged in; nested dicts are
+    merged key by key except REPLACED_CONFIG_KEYS
+    """
+    merged = copy.deepcopy(defaults)
+    for key, value in overrides.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict) and key not in REPLACED_CONFIG_KEYS:
+            merged[key] = merge_config(merged[key], value)
+        else:
+            merged[key] = copy.deepcopy(value)
+    return merged
+
+
+def use_site_config(overrides, sink=None):
+    """
+    Makes CONFIG (and log()) resolve to a site's config for the current
+    task and the tasks it starts. Page and route callbacks run outside
+    the task, so anything they read comes from the defaults or is passed
+    to them explicitly.
+    """
+    _SITE_CONFIG.set(merge_config(CONFIG.defaults, overrides))
+    _SITE_SINK.set(sink)
+
+
+CONFIG = ConfigView({
     "url": "https://tiffinworld.com/auth/customer",
     # "submit_selector": "button[type=button]",
     "submit_selector": "button#continueBtn",
     "delay_between_tests": 2,
-    "wait_after_submit": 5,
+    "wait_after_submit": 5,     # upper bound (seconds) for the settle engine
+    "settle_quiet_ms": 300,     # DOM must stay unchanged this long to count as settled
+    "workers": 1,  # isolated browser contexts running cases concurrently
+    "launch_profile": "visible",  # see launch_profiles.py: "visible" or "ci"
+    "headless": None,  # overrides the profile's headless setting when not None
+    "incremental_tracking": True,  # persistent MutationObserver instead of full signature diffs
+
+    # How field values are entered:
+    #   "bulk" - every field in one evaluate, per-field fill only for what it cannot handle
+    #   "fill" - page.fill / check / select_option per field
+    #   "type" - per field, with real keystrokes for text inputs
+    "fill_mode": "bulk",
+
+    # How a page is brought back to a clean form between cases:
+    #   "navigate" - page.goto() every case
+    #   "snapshot" - clear cookies/storage and re-render from a cached copy of the page;
+    #                not for pages that embed a per-session token (CSRF), since every
+    #                case then submits the token of the first fetch
+    #   "in_place" - reset the form DOM when still on the form, navigate otherwise
+    "reset_strategy": "navigate",
+
+    # How cases are generated from TEST_DATA:
+    #   "single"   - vary one field at a time, others get filler values
+    #   "pairwise" - cover every pair of values across enabled fields
+    #   "nwise"    - cover every combination of `strength` fields
+    "matrix": {
+        "mode": "single",
+        "strength": 3
+    },
+
+    # -------------------------------
+    # STATIC ASSET CACHE / HAR REPLAY
+    # -------------------------------
+    "asset_cache": {
+        "enabled": False,
+        "dir": ".asset_cache",
+        "resource_types": ["script", "stylesheet", "font", "image"],
+        "revalidate": False  # send If-None-Match with the cached ETag instead of serving blindly
+    },
+    "har": {
+        "mode": None,  # None, "record" or "replay"
+        "path": "session.har",
+        "not_found": "abort"  # "abort" keeps replay fully offline, "fallback" hits the network
+    },
+
+    # -------------------------------
+    # PRE-VALIDATION
+    # Cases the page's HTML5 constraints would block are predicted
+    # locally; confirm_rate of them still run in the browser
+    # -------------------------------
+    "prevalidation": {
+        "enabled": False,
+        "confirm_rate": 0.1
+    },
+
+    # -------------------------------
+    # RESULT CACHE
+    # Verdicts are reused across runs while the form's structural
+    # fingerprint is unchanged; verify_rate of hits are re-run anyway
+    # -------------------------------
+    "result_cache": {
+        "enabled": False,
+        "path": ".result_cache.sqlite",
+        "ttl_hours": 24,
+        "verify_rate": 0.1
+    },
+
+    # -------------------------------
+    # DIRECT HTTP FUZZING
+    # The submit request is learned from one browser submit with valid
+    # values, then every case is replayed over HTTP (sharing the browser
+    # context's cookies) instead of through the page
+    # -------------------------------
+    "http_fuzz": {
+        "enabled": False,
+        "concurrency": 10,
+        "rate_per_second": 20,  # 0 disables rate limiting
+        "learn_timeout": 10     # seconds to wait for the learning submit
+    },
+
+    # -------------------------------
+    # RESOURCE BLOCKING
+    # -------------------------------
+    "block": {
+        "enabled": False,
+        "resource_types": ["image", "font", "media"],
+        "url_patterns": [
+            "*google-analytics.com*",
+            "*googletagmanager.com*",
+            "*doubleclick.net*",
+            "*facebook.net*",
+            "*hotjar.com*"
+        ]
+    },
 
     # -------------------------------
     # SUCCESS DETECTION CONFIG
@@ -203,7 +710,41 @@ CONFIG = {
             ".error",
             ".invalid-feedback",
             ".toast-error"
-        ]
+        ],
+
+        # Verdicts from the responses to requests the submit click triggers
+        # (XHR/fetch, or a POSTed document). Body rules apply to JSON bodies,
+        # first match wins; otherwise 2xx XHR/fetch means accepted and 4xx
+        # rejected. Anything else is left to the DOM checks.
+        "network": {
+            "methods": ["POST", "PUT", "PATCH"],
+            "url_patterns": [],  # fnmatch patterns; empty means same origin as "url"
+            "body_rules": [
+                {"path": "success", "equals": False, "verdict": False},
+                {"path": "status", "in": ["error", "fail", "failed"], "verdict": False},
+                {"path": "errors", "truthy": True, "verdict": False},
+                {"path": "error", "truthy": True, "verdict": False},
+                {"path": "success", "equals": True, "verdict": True},
+                {"path": "status", "in": ["success", "ok"], "verdict": True}
+            ]
+        }
+    },
+
+    # -------------------------------
+    # HOST POLITENESS
+    # Shared by every site run in the same process with the same host
+    # -------------------------------
+    "max_per_host": None,       # concurrent cases per host; None means only "workers" applies
+    "politeness_delay_ms": 0,   # minimum gap between case starts on one host
+
+    # -------------------------------
+    # DETECTION RULES
+    # Extra inline-error / success-URL keywords, regexes and selectors,
+    # per site and per locale, without code changes (see detection_rules.py)
+    # -------------------------------
+    "detection_rules": {
+        "path": "detection_rules.json",  # optional; relative to this directory, ignored when missing
+        "locales": []                    # e.g. ["es", "hi"]
     },
 
     # -------------------------------
@@ -286,7 +827,7 @@ CONFIG = {
             "enabled": False
         }
     }
-}
+})
 
 # ===============================
 # TEST DATA BY FIELD TYPE
@@ -342,19 +883,114 @@ def create_log_file(url):
     filename = f"{domain}-{timestamp}.txt"
     return filename
 
-LOG_FILE = create_log_file(CONFIG["url"])
+# One open handle per file, written from a background thread. Created on
+# the first log() so importing this module leaves no files behind; a caller
+# may set its own sink before running.
+SINK = None
+
+# Per-site sink during batch runs (see use_site_config)
+_SITE_SINK = contextvars.ContextVar("site_sink", default=None)
+
+
+def default_sink():
+    global SINK
+    if SINK is None:
+        log_file = create_log_file(CONFIG["url"])
+        SINK = ResultsSink(log_file, os.path.splitext(log_file)[0] + ".jsonl")
+        atexit.register(SINK.close)
+    return SINK
+
+
+def current_sink():
+    return _SITE_SINK.get() or default_sink()
+
 
 def log(message):
-    print(message)
-    with open(LOG_FILE, "a", encoding="utf-8") as f:
-        f.write(message + "\n")
+    current_sink().log(message)
 
 
 # ===============================
 # FIELD FILLING LOGIC
 # ===============================
 
-async def fill_field(page, field, value):
+# Applies [{name, selector, type, value, label}] in one round-trip using the
+# native value setters plus input/change/blur, so framework-controlled inputs
+# still see the change. Returns the names it could not handle (selector is
+# not plain CSS, element missing/hidden/disabled, option not found); those
+# go through fill_field and its actionability waits.
+BULK_FILL_SCRIPT = """
+    (steps) => {
+        const isVisible = (el) => {
+            const s = window.getComputedStyle(el);
+            const rect = el.getBoundingClientRect();
+            return s.display !== 'none' && s.visibility !== 'hidden' && rect.width > 0 && rect.height > 0;
+        };
+
+        // Playwright's :visible is not CSS, so it is applied here instead
+        const find = (selector) => {
+            const matches = Array.from(document.querySelectorAll(selector.replaceAll(':visible', '')));
+            const el = selector.includes(':visible') ? matches.find(isVisible) : matches[0];
+            return el && isVisible(el) ? el : null;
+        };
+
+        const setValue = (el, value) => {
+            const proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype
+                : el instanceof HTMLSelectElement ? HTMLSelectElement.prototype
+                : HTMLInputElement.prototype;
+            Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, value);
+        };
+
+        const fire = (el, ...types) => {
+            types.forEach(type => el.dispatchEvent(new Event(type, { bubbles: true })));
+        };
+
+        const skipped = [];
+
+        for (const { name, selector, type, value, label } of steps) {
+            let el;
+            try {
+                el = find(type === 'radio' ? `${selector}[value='${value}']` : selector);
+            } catch (e) {
+                el = null;
+            }
+
+            if (!el || el.disabled || el.readOnly) {
+                skipped.push(name);
+                continue;
+            }
+
+            if (type === 'radio') {
+                if (!el.checked) {
+                    el.click();
+                }
+                continue;
+            }
+
+            let newValue = value ?? '';
+            if (type === 'select') {
+                const option = Array.from(el.options).find(o => o.label.trim() === label);
+                if (!option) {
+                    skipped.push(name);
+                    continue;
+                }
+                newValue = option.value;
+            } else if (el.maxLength > 0) {
+                // Keystrokes and page.fill stop at maxlength too
+                newValue = String(newValue).slice(0, el.maxLength);
+            }
+
+            el.focus();
+            setValue(el, newValue);
+            fire(el, 'input', 'change');
+            el.blur();
+        }
+
+        return skipped;
+    }
+"""
+
+
+async def fill_field(page, field, value, typed=False):
     ftype = field["type"]
 
     if ftype == "radio":
@@ -368,131 +1004,1323 @@ async def fill_field(page, field, value):
             label=field["value"]
         )
 
+    elif typed:
+        # Real keystrokes, one key at a time
+        locator = page.locator(field["selector"])
+        await locator.fill("")
+        if value:
+            await locator.press_sequentially(value)
+
     else:
         await page.fill(field["selector"], value)
 
+
+async def fill_fields(page, values):
+    """
+    Fills {field_name: value} according to CONFIG["fill_mode"]
+    """
+    mode = CONFIG["fill_mode"]
+    pending = list(values)
+
+    if mode == "bulk":
+        steps = [
+            {
+                "name": name,
+                "selector": CONFIG["fields"][name]["selector"],
+                "type": CONFIG["fields"][name]["type"],
+                "value": values[name],
+                "label": CONFIG["fields"][name].get("value")
+            }
+            for name in pending
+        ]
+        pending = await page.evaluate(BULK_FILL_SCRIPT, steps)
+
+    for name in pending:
+        await fill_field(page, CONFIG["fields"][name], values[name], typed=mode == "type")
+
+# ===============================
+# SUBMIT SETTLE ENGINE
+# ===============================
+
+# Records the time of the last DOM mutation and exposes quiet(), which
+# resolves once the DOM has not changed for `quietMs` milliseconds.
+# The observer of a previous case on the same document is disconnected first.
+SETTLE_OBSERVER_SCRIPT = """
+    (quietMs) => {
+        if (window.__formSettle) {
+            window.__formSettle.observer.disconnect();
+        }
+        const state = window.__formSettle = { last: performance.now() };
+
+        state.observer = new MutationObserver(() => {
+            state.last = performance.now();
+        });
+        state.observer.observe(document, {
+            childList: true,
+            subtree: true,
+            attributes: true,
+            characterData: true
+        });
+
+        state.touch = () => { state.last = performance.now(); };
+
+        state.quiet = () => new Promise(resolve => {
+            const check = () => {
+                const idle = performance.now() - state.last;
+                if (idle >= quietMs) {
+                    resolve(true);
+                } else {
+                    setTimeout(check, quietMs - idle);
+                }
+            };
+            check();
+        });
+    }
+"""
+
+SETTLE_TRACKED_RESOURCES = ("document", "xhr", "fetch")
+
+
+async def _settle_signal(name, awaitable):
+    """Resolves to `name` when the awaitable completes, None if it fails"""
+    try:
+        await awaitable
+        return name
+    except Exception:
+        return None
+
+
+async def _race_settle_signals(tasks, timeout):
+    """
+    Returns the first signal name produced by `tasks` within `timeout`
+    seconds, or "timeout". Pending tasks are cancelled either way.
+    """
+    deadline = time.monotonic() + timeout
+    pending = set(tasks)
+
+    try:
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+
+            done, pending = await asyncio.wait(
+                pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                if task.result() is not None:
+                    return task.result()
+
+        return "timeout"
+
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+# ===============================
+# NETWORK VERDICT ENGINE
+# ===============================
+
+NETWORK_SUBMIT_RESOURCES = ("xhr", "fetch", "document")
+
+_MISSING = object()
+
+
+def url_origin(url):
+    parsed = urlparse(url)
+    return parsed.scheme, parsed.netloc
+
+
+def is_submit_request(request, net=None, site_url=None):
+    """
+    Whether a request fired after the submit click carries the submission.
+    Without url_patterns only requests to the site's own origin count, so
+    analytics and chat widgets posting elsewhere do not decide the verdict.
+    Page callbacks pass `net` (the network config) and `site_url` explicitly.
+    """
+    net = net or CONFIG["success_detection"]["network"]
+    site_url = site_url or CONFIG["url"]
+
+    if request.resource_type not in NETWORK_SUBMIT_RESOURCES:
+        return False
+    if request.method not in net["methods"]:
+        return False
+
+    patterns = net["url_patterns"]
+    if not patterns:
+        return url_origin(request.url) == url_origin(site_url)
+    return any(fnmatch.fnmatch(request.url, p) for p in patterns)
+
+
+def json_path(data, path):
+    """
+    Looks up a dotted path ("data.user.id", "errors.0") in parsed JSON
+    """
+    for key in path.split("."):
+        if isinstance(data, dict) and key in data:
+            data = data[key]
+        elif isinstance(data, list) and key.isdigit() and int(key) < len(data):
+            data = data[int(key)]
+        else:
+            return _MISSING
+    return data
+
+
+def rule_matches(rule, body):
+    value = json_path(body, rule["path"])
+    if value is _MISSING:
+        return False
+
+    if "equals" in rule:
+        return value == rule["equals"]
+    if "in" in rule:
+        return value in rule["in"]
+    if "truthy" in rule:
+        return bool(value) == rule["truthy"]
+    return True  # only "exists" was asked for
+
+
+def classify_network_result(method, url, resource_type, status, body=_MISSING, net=None):
+    """
+    Returns (verdict, reason) for a submit response; verdict is None
+    when the response alone does not decide the case
+    """
+    net = net or CONFIG["success_detection"]["network"]
+    label = f"{method} {urlparse(url).path or '/'} {status}"
+
+    if resource_type == "document":
+        # A re-rendered page can be a 200 either way; only a 4xx is conclusive
+        if 400 <= status < 500:
+            return False, f"Network Rejected ({label})"
+        return None, f"Network Inconclusive ({label})"
+
+    if body is not _MISSING:
+        for rule in net["body_rules"]:
+            if rule_matches(rule, body):
+                state = "Accepted" if rule["verdict"] else "Rejected"
+                return rule["verdict"], f"Network {state} ({label}, {rule['path']})"
+
+    if 200 <= status < 300:
+        return True, f"Network Accepted ({label})"
+    if 400 <= status < 500:
+        return False, f"Network Rejected ({label})"
+    return None, f"Network Inconclusive ({label})"
+
+
+async def classify_submit_response(response, net=None):
+    """
+    Classifies a browser Response to a submit request
+    """
+    request = response.request
+
+    body = _MISSING
+    if request.resource_type != "document":
+        try:
+            body = await response.json()
+        except Exception:
+            pass
+
+    return classify_network_result(
+        request.method, request.url, request.resource_type, response.status, body, net
+    )
+
+
+async def click_and_settle(page, selector, old_url, timer=None):
+    """
+    Clicks the submit button and waits for the first conclusive signal:
+    URL navigation, a success/error selector becoming visible, or the DOM
+    going quiet with no submit-related requests in flight, or (when
+    "network_success" is in method_priority) a conclusive submit response.
+    CONFIG["wait_after_submit"] is only the upper bound.
+    Returns (winning signal name or "timeout", network verdict or None).
+    The click and the wait are timed as the "submit" and "settle" phases.
+    """
+    timer = timer or PhaseTimer()
+    cfg = CONFIG["success_detection"]
+    timeout = CONFIG["wait_after_submit"]
+    timeout_ms = timeout * 1000
+
+    inflight = set()
+    watch_network = "network_success" in cfg["method_priority"]
+    # Callbacks run outside this task, so they get the site's settings passed
+    net = cfg["network"]
+    site_url = CONFIG["url"]
+    network_verdict = None
+    network_decided = asyncio.Event()
+    classify_tasks = set()
+
+    def on_request(request):
+        if request.resource_type in SETTLE_TRACKED_RESOURCES:
+            inflight.add(request)
+
+    def on_request_done(request):
+        inflight.discard(request)
+
+    async def classify(response):
+        nonlocal network_verdict
+        verdict = await classify_submit_response(response, net)
+        if network_verdict is None or (network_verdict[0] is None and verdict[0] is not None):
+            network_verdict = verdict
+        if verdict[0] is not None:
+            network_decided.set()
+
+    def on_response(response):
+        if is_submit_request(response.request, net, site_url):
+            task = asyncio.create_task(classify(response))
+            classify_tasks.add(task)
+            task.add_done_callback(classify_tasks.discard)
+
+    async def dom_and_network_quiet():
+        while True:
+            await page.evaluate("() => window.__formSettle.quiet()")
+            if not inflight:
+                return
+
+            while inflight:
+                await asyncio.sleep(0.05)
+
+            # Give response handlers a fresh quiet window to render
+            await page.evaluate("() => window.__formSettle.touch()")
+
+    page.on("request", on_request)
+    page.on("requestfinished", on_request_done)
+    page.on("requestfailed", on_request_done)
+    if watch_network:
+        page.on("response", on_response)
+
+    try:
+        with timer.phase("submit"):
+            await page.evaluate(SETTLE_OBSERVER_SCRIPT, CONFIG["settle_quiet_ms"])
+            await page.click(selector)
+
+        message_selectors = ", ".join(
+            cfg["success_message_selectors"] + cfg["error_message_selectors"]
+        )
+
+        with timer.phase("settle"):
+            started = time.monotonic()
+            signals = [
+                asyncio.create_task(_settle_signal(
+                    "url_change",
+                    page.wait_for_url(
+                        lambda url: url != old_url,
+                        wait_until="commit",
+                        timeout=timeout_ms
+                    )
+                )),
+                asyncio.create_task(_settle_signal(
+                    "message_visible",
+                    page.wait_for_selector(
+                        message_selectors, state="visible", timeout=timeout_ms
+                    )
+                )),
+                asyncio.create_task(_settle_signal(
+                    "dom_quiet", dom_and_network_quiet()
+                ))
+            ]
+            if watch_network:
+                signals.append(asyncio.create_task(_settle_signal(
+                    "network_response", network_decided.wait()
+                )))
+
+            signal = await _race_settle_signals(signals, timeout)
+
+            # "commit" fires on a nearly empty document; let the new page
+            # parse before detection snapshots it
+            if signal == "url_change":
+                remaining = timeout - (time.monotonic() - started)
+                if remaining > 0:
+                    try:
+                        await page.wait_for_load_state("domcontentloaded", timeout=remaining * 1000)
+                    except TimeoutError:
+                        pass
+
+            # A response that already arrived is still classified
+            if classify_tasks:
+                await asyncio.wait(set(classify_tasks), timeout=1)
+
+        return signal, network_verdict
+
+    finally:
+        page.remove_listener("request", on_request)
+        page.remove_listener("requestfinished", on_request_done)
+        page.remove_listener("requestfailed", on_request_done)
+        if watch_network:
+            page.remove_listener("response", on_response)
+        for task in classify_tasks:
+            task.cancel()
+
+
 # ===============================
 # SUCCESS DETECTION LOGIC
 # ===============================
 
-async def detect_success(page, old_url, old_form_signature=None):
+async def detect_success(page, old_url, old_form_signature=None, form_watch_token=None, network_verdict=None):
+    """
+    Runs the checks grouped under each method_priority entry in order:
+      url_change       - URL moved to a success keyword
+      network_success  - the submit response's verdict
+      success_message  - success selector, inline errors, error selectors
+      form_disappears  - form changed to a next step, submit disabled
+    """
     cfg = CONFIG["success_detection"]
+    snapshot = None
+
+    for method in cfg["method_priority"]:
 
-    # 1️⃣ URL CHANGE
-    if page.url != old_url:
-        for kw in cfg["success_url_keywords"]:
-            if kw in page.url.lower():
+        # 1️⃣ URL CHANGE
+        if method == "url_change":
+            if page.url != old_url and detection_rules().match_success_url(page.url):
                 return True, "URL Changed"
+            continue
 
-    # 2️⃣ SUCCESS MESSAGE
-    for selector in cfg["success_message_selectors"]:
-        try:
-            if await page.locator(selector).is_visible():
+        # 2️⃣ NETWORK RESPONSE
+        if method == "network_success":
+            if network_verdict is not None and network_verdict[0] is not None:
+                return network_verdict
+            continue
+
+        # ONE SNAPSHOT FEEDS ALL DOM-BASED CHECKS BELOW
+        if snapshot is None:
+            snapshot = await get_form_snapshot(page)
+
+        if method == "success_message":
+            # 3️⃣ SUCCESS MESSAGE
+            if snapshot["success_visible"]:
                 return True, "Success Message Found"
-        except:
-            pass
 
-    # 3️⃣ INLINE VALIDATION ERROR (NEW)
-    has_inline_error, error_text = await detect_inline_validation_error(page)
-    if has_inline_error:
-        return False, f"Inline Validation Error: {error_text}"
+            # 4️⃣ INLINE VALIDATION ERROR
+            has_inline_error, error_text = await detect_inline_validation_error(page, snapshot)
+            if has_inline_error:
+                return False, f"Inline Validation Error: {error_text}"
 
-    # 4️⃣ ERROR MESSAGE SELECTORS
-    for selector in cfg["error_message_selectors"]:
-        try:
-            if await page.locator(selector).is_visible():
+            # 5️⃣ ERROR MESSAGE SELECTORS
+            if snapshot["error_visible"]:
                 return False, "Error Message Found"
-        except:
-            pass
 
-    # 5️⃣ FORM CHANGED
-    if old_form_signature is not None:
-        try:
-            await page.wait_for_timeout(800)
+        elif method == "form_disappears":
+            # 6️⃣ FORM CHANGED
+            if form_watch_token is not None:
+                delta = await take_form_delta(page, form_watch_token)
+                if delta is None or form_changed(delta, old_form_signature, snapshot["signature"]):
+                    return True, "Form Changed (Next Step)"
 
-            new_form_signature = await get_form_signature(page)
-            if new_form_signature and new_form_signature != old_form_signature:
-                return True, "Form Changed (Next Step)"
-        except:
-            pass
+            elif old_form_signature is not None:
+                new_form_signature = snapshot["signature"]
+                if new_form_signature and new_form_signature != old_form_signature:
+                    return True, "Form Changed (Next Step)"
 
-    # 6️⃣ SUBMIT BUTTON DISABLED
-    try:
-        submit_btn = page.locator(CONFIG["submit_selector"])
-        if not await submit_btn.is_enabled():
-            return True, "Submit Button Disabled"
-    except:
-        pass
+            # 7️⃣ SUBMIT BUTTON DISABLED
+            if snapshot["submit_enabled"] is False:
+                return True, "Submit Button Disabled"
 
+    if network_verdict is not None:
+        return None, network_verdict[1]
     return None, "Inconclusive"
 
 
+# ===============================
+# PAGE RESET STRATEGY
+# ===============================
+
+# Restores every control to its default value without reloading the page
+RESTORE_FORM_SCRIPT = """
+    () => {
+        for (const form of document.forms) {
+            form.reset();
+        }
+
+        for (const el of document.querySelectorAll('input, select, textarea')) {
+            if (el.form) {
+                continue;
+            }
+
+            if (el.type === 'checkbox' || el.type === 'radio') {
+                el.checked = el.defaultChecked;
+            } else if (el.tagName === 'SELECT') {
+                for (const option of el.options) {
+                    option.selected = option.defaultSelected;
+                }
+            } else {
+                el.value = el.defaultValue;
+            }
+        }
+    }
+"""
+
+# Signature of each page right after its last full navigation
+PRISTINE_SIGNATURES = {}
+
+# Main document responses cached for the "snapshot" strategy, keyed by URL
+DOCUMENT_CACHE = {}
+
+
+async def serve_cached_document(route):
+    """
+    Route handler serving the target page from DOCUMENT_CACHE after its first fetch.
+    Set-Cookie is not replayed, so cases do not share the first server session;
+    a token embedded in the body is replayed as is (see "reset_strategy").
+    """
+    request = route.request
+    if request.resource_type != "document" or request.method != "GET":
+        await route.fallback()
+        return
+
+    cached = DOCUMENT_CACHE.get(request.url)
+    if cached is None:
+        response = await route.fetch()
+        headers = {
+            k: v for k, v in response.headers.items()
+            if k.lower() not in ("content-encoding", "content-length", "set-cookie")
+        }
+        cached = {
+            "status": response.status,
+            "headers": headers,
+            "body": await response.body()
+        }
+        if response.ok:
+            DOCUMENT_CACHE[request.url] = cached
+
+    await route.fulfill(
+        status=cached["status"],
+        headers=cached["headers"],
+        body=cached["body"]
+    )
+
+
+async def clear_storage(page):
+    """
+    Drops cookies and web storage so the next case starts from a fresh session
+    """
+    await page.context.clear_cookies()
+
+    try:
+        await page.evaluate("() => { localStorage.clear(); sessionStorage.clear(); }")
+    except Exception:
+        pass  # about:blank or an opaque origin has no storage to clear
+
+
+async def restore_form_in_place(page):
+    """
+    Resets the form DOM when the page is still on the pristine form step.
+    Returns False when a navigation is needed instead.
+    """
+    pristine = PRISTINE_SIGNATURES.get(page)
+    if pristine is None or page.url != pristine["url"]:
+        return False
+
+    try:
+        await page.evaluate(RESTORE_FORM_SCRIPT)
+        return await get_form_signature(page) == pristine["signature"]
+    except Exception:
+        return False
+
+
+async def load_form(page):
+    """
+    Brings the page to a clean form according to CONFIG["reset_strategy"]
+    """
+    strategy = CONFIG["reset_strategy"]
+
+    if strategy == "in_place" and await restore_form_in_place(page):
+        return
+
+    if strategy == "snapshot":
+        await clear_storage(page)
+
+    await page.goto(CONFIG["url"], timeout=60000)
+
+    if strategy == "in_place":
+        PRISTINE_SIGNATURES[page] = {
+            "url": page.url,
+            "signature": await get_form_signature(page)
+        }
+
+
+# ===============================
+# STATIC ASSET CACHE / HAR REPLAY
+# ===============================
+
+def asset_cache_paths(url, cache_dir=None):
+    """
+    Returns the (body, metadata) file paths caching a URL
+    """
+    key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    base = os.path.join(cache_dir or CONFIG["asset_cache"]["dir"], key)
+    return base + ".body", base + ".json"
+
+
+def write_cache_file(path, data):
+    """
+    Writes through a temporary file and os.replace, so a worker serving the
+    previous copy with fulfill(path=...) never reads a truncated file
+    """
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+async def serve_cached_asset(route, *, cfg=None):
+    """
+    Route handler serving static assets from disk, fetching and storing them on a miss.
+    With "revalidate" the cached ETag is sent upstream and a 304 is served from disk.
+    Route callbacks run outside the site task, so `cfg` is bound at registration.
+    """
+    cfg = cfg or CONFIG["asset_cache"]
+    request = route.request
+
+    if request.method != "GET" or request.resource_type not in cfg["resource_types"]:
+        await route.fallback()
+        return
+
+    body_path, meta_path = asset_cache_paths(request.url, cfg["dir"])
+    meta = None
+    if os.path.exists(meta_path) and os.path.exists(body_path):
+        with open(meta_path, encoding="utf-8") as f:
+            meta = json.load(f)
+
+    if meta and not cfg["revalidate"]:
+        await route.fulfill(status=meta["status"], headers=meta["headers"], path=body_path)
+        return
+
+    headers = dict(request.headers)
+    if meta and meta.get("etag"):
+        headers["if-none-match"] = meta["etag"]
+
+    response = await route.fetch(headers=headers)
+
+    if response.status == 304 and meta:
+        await route.fulfill(status=meta["status"], headers=meta["headers"], path=body_path)
+        return
+
+    body = await response.body()
+    response_headers = {
+        k: v for k, v in response.headers.items()
+        if k.lower() not in ("content-encoding", "content-length")
+    }
+
+    if response.ok:
+        os.makedirs(cfg["dir"], exist_ok=True)
+        # Body first: the metadata file is what marks an entry as cached
+        write_cache_file(body_path, body)
+        write_cache_file(meta_path, json.dumps({
+            "url": request.url,
+            "status": response.status,
+            "headers": response_headers,
+            "etag": response.headers.get("etag")
+        }))
+
+    await route.fulfill(status=response.status, headers=response_headers, body=body)
+
+
+async def block_resources(route, *, cfg=None):
+    """
+    Route handler aborting requests matched by CONFIG["block"] (or `cfg`,
+    bound at registration like serve_cached_asset)
+    """
+    cfg = cfg or CONFIG["block"]
+    request = route.request
+
+    if request.resource_type in cfg["resource_types"] or any(
+        fnmatch.fnmatchcase(request.url, pattern) for pattern in cfg["url_patterns"]
+    ):
+        await route.abort()
+    else:
+        await route.fallback()
+
+
+def har_path_for_worker(index):
+    """
+    Each recording worker writes its own HAR: session.har, session-1.har, ...
+    """
+    path = CONFIG["har"]["path"]
+    if index == 0:
+        return path
+
+    root, ext = os.path.splitext(path)
+    return f"{root}-{index}{ext}"
+
+
+def recorded_har_paths():
+    """
+    All HAR files written by a previous "record" run
+    """
+    path = CONFIG["har"]["path"]
+    root, ext = os.path.splitext(path)
+    return [path] + sorted(glob.glob(f"{root}-*{ext}"))
+
+
+# ===============================
+# TEST CASE EXECUTION
+# ===============================
+
+def build_cases():
+    """
+    Lazily expands the enabled fields and TEST_DATA into ordered
+    (field_name, value, expected, fill_values) cases
+    """
+    matrix = CONFIG["matrix"]
+
+    if matrix["mode"] == "single":
+        for field_name, field in CONFIG["fields"].items():
+            if not field["enabled"]:
+                continue
+
+            for value, expected in TEST_DATA.get(field["type"], []):
+                yield field_name, value, expected, build_fill_values(field_name, value)
+        return
+
+    # Dependent fields follow their source, so only independent ones vary
+    parameters = {
+        name: TEST_DATA[f["type"]]
+        for name, f in CONFIG["fields"].items()
+        if f["enabled"] and "depends_on" not in f and f["type"] in TEST_DATA
+    }
+
+    # Rows filling the same values are one case, whatever their expectations;
+    # keyed before "__UNIQUE_EMAIL__" expands to a fresh address
+    same_values = lambda row: tuple(sorted((name, value) for name, (value, _) in row.items()))
+
+    for row in matrix_rows(parameters, matrix["mode"], matrix["strength"], key=same_values):
+        label = " | ".join(f"{name}={value!r}" for name, (value, _) in row.items())
+        expected = all(valid for _, valid in row.values())
+        yield (
+            matrix["mode"],
+            label,
+            expected,
+            build_row_fill_values({name: value for name, (value, _) in row.items()})
+        )
+
+
+def build_fill_values(field_name, value):
+    """
+    Values every enabled field is filled with when testing `value` on `field_name`
+    """
+    shared_values = {}
+
+    for name, f in CONFIG["fields"].items():
+        if not f["enabled"]:
+            continue
+
+        if f["type"] == "email" and value == "__UNIQUE_EMAIL__":
+            fill_value = generate_unique_email()
+
+        elif "depends_on" in f:
+            fill_value = shared_values.get(f["depends_on"])
+
+        elif name == field_name:
+            fill_value = value
+
+        else:
+            fill_value = "Valid123"
+
+        shared_values[name] = fill_value
+
+    return shared_values
+
+
+def build_row_fill_values(row):
+    """
+    Values every enabled field is filled with for one matrix row
+    """
+    shared_values = {}
+
+    for name, f in CONFIG["fields"].items():
+        if not f["enabled"]:
+            continue
+
+        if "depends_on" in f:
+            fill_value = shared_values.get(f["depends_on"])
+
+        elif row.get(name) == "__UNIQUE_EMAIL__":
+            fill_value = generate_unique_email()
+
+        elif name in row:
+            fill_value = row[name]
+
+        else:
+            fill_value = "Valid123"
+
+        shared_values[name] = fill_value
+
+    return shared_values
+
+
+async def extract_constraints(page):
+    """
+    Reads the HTML5 constraints of every enabled text-like field once
+    """
+    constraints = {}
+
+    for name, f in CONFIG["fields"].items():
+        if not f["enabled"] or f["type"] in ("radio", "select"):
+            continue
+
+        try:
+            constraints[name] = await page.locator(f["selector"]).first.evaluate(
+                CONSTRAINTS_SCRIPT, timeout=5000
+            )
+        except Exception:
+            pass  # field not on the page; nothing to predict
+
+    return constraints
+
+
+def form_structure(signature, constraints):
+    """
+    Structural description of the form used as the result-cache fingerprint.
+    Visible texts are left out because they change between loads.
+    """
+    return {
+        "url": CONFIG["url"],
+        "submit_selector": CONFIG["submit_selector"],
+        "inputs": signature["active_inputs"],
+        "buttons": signature["active_button_texts"],
+        "constraints": constraints
+    }
+
+
+async def run_case(page, field_name, value, expected, fill_values=None):
+    timer = PhaseTimer()
+
+    if fill_values is None:
+        fill_values = build_fill_values(field_name, value)
+
+    with timer.phase("navigate"):
+        await load_form(page)
+
+    with timer.phase("fill"):
+        await fill_fields(page, fill_values)
+
+    # START AN INCREMENTAL DELTA WINDOW (WHEN THE FORM WATCH IS INSTALLED)
+    # AND CAPTURE THE FULL SIGNATURE IN THE SAME ROUND-TRIP
+    with timer.phase("signature"):
+        form_watch_token = None
+        if CONFIG["incremental_tracking"]:
+            form_watch_token, old_form_signature = await start_form_watch(page)
+        else:
+            old_form_signature = await get_form_signature(page)
+        old_url = page.url
+
+    settle_signal, network_verdict = await click_and_settle(
+        page, CONFIG["submit_selector"], old_url, timer
+    )
+
+    # PASS THE OLD SIGNATURE (OR WATCH TOKEN) FOR COMPARISON
+    with timer.phase("detect"):
+        result, reason = await detect_success(
+            page, old_url, old_form_signature, form_watch_token, network_verdict
+        )
+    status = "PASS" if result == expected else "FAIL"
+
+    # Back off only when the target did not settle within the upper bound
+    if settle_signal == "timeout":
+        await asyncio.sleep(CONFIG["delay_between_tests"])
+
+    return {
+        "field": field_name,
+        "input": value,
+        "expected": expected,
+        "actual": result,
+        "status": status,
+        "reason": reason,
+        "timings": timer.finish()
+    }
+
+
+# ===============================
+# DIRECT HTTP FUZZING
+# ===============================
+
+CSRF_KEYS = ("_token", "csrf_token", "csrfmiddlewaretoken", "authenticity_token", "__requestverificationtoken")
+
+# Headers the HTTP client sets itself (cookies come from the context)
+REPLAY_DROPPED_HEADERS = ("content-length", "cookie", "host", "connection", "accept-encoding")
+
+
+def valid_row():
+    """
+    The first valid TEST_DATA value of every independent enabled field
+    """
+    row = {}
+    for name, f in CONFIG["fields"].items():
+        if not f["enabled"] or "depends_on" in f:
+            continue
+        valid = [value for value, expected in TEST_DATA.get(f["type"], []) if expected]
+        if valid:
+            row[name] = valid[0]
+    return row
+
+
+def parse_request_body(content_type, post_data):
+    """
+    Returns ("json" | "form", dict) for a replayable request body
+    """
+    if "application/json" in content_type:
+        body = json.loads(post_data or "{}")
+        if isinstance(body, dict):
+            return "json", body
+
+    elif "application/x-www-form-urlencoded" in content_type:
+        return "form", dict(parse_qsl(post_data or "", keep_blank_values=True))
+
+    raise ValueError(f"Cannot replay a '{content_type or 'unknown'}' submit body")
+
+
+async def learn_submit_request(page):
+    """
+    Submits the form once with valid values and records how the submission
+    travels: method, endpoint, headers, body encoding and which body key
+    carries each configured field
+    """
+    fill_values = build_row_fill_values(valid_row())
+
+    await load_form(page)
+    await fill_fields(page, fill_values)
+
+    net = CONFIG["success_detection"]["network"]
+    site_url = CONFIG["url"]
+    async with page.expect_request(
+        lambda request: is_submit_request(request, net, site_url),
+        timeout=CONFIG["http_fuzz"]["learn_timeout"] * 1000
+    ) as request_info:
+        await page.click(CONFIG["submit_selector"])
+    request = await request_info.value
+
+    headers = await request.all_headers()
+    encoding, body = parse_request_body(headers.get("content-type", ""), request.post_data)
+
+    keys = {}
+    for name, value in fill_values.items():
+        try:
+            input_name = await page.locator(CONFIG["fields"][name]["selector"]).first.evaluate(
+                "el => el.name", timeout=1000
+            )
+        except Exception:
+            input_name = None  # the page already moved on
+
+        if input_name in body:
+            keys[name] = input_name
+            continue
+
+        # Otherwise match the key by the value that was filled in
+        matches = [key for key, sent in body.items() if sent == value]
+        if len(matches) == 1:
+            keys[name] = matches[0]
+        else:
+            log(f"⚠️ HTTP fuzz: no body key found for field '{name}', it will not be varied")
+
+    return {
+        "method": request.method,
+        "url": request.url,
+        "resource_type": request.resource_type,
+        "headers": {
+            k: v for k, v in headers.items()
+            if not k.startswith(":") and k.lower() not in REPLAY_DROPPED_HEADERS
+        },
+        "encoding": encoding,
+        "body": body,
+        "keys": keys,
+        "csrf": [k for k in body if k.lower() in CSRF_KEYS]
+                + [k for k in headers if "csrf" in k.lower() or "xsrf" in k.lower()]
+    }
+
+
+def rate_limiter(rate_per_second):
+    """
+    Returns an awaitable that spaces calls at least 1/rate seconds apart
+    """
+    interval = 1 / rate_per_second if rate_per_second else 0
+    lock = asyncio.Lock()
+    next_slot = 0.0
+
+    async def wait():
+        nonlocal next_slot
+        if not interval:
+            return
+        async with lock:
+            now = time.monotonic()
+            delay = next_slot - now
+            next_slot = max(now, next_slot) + interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    return wait
+
+
+async def run_http_case(api, template, field_name, value, expected, fill_values):
+    """
+    Replays the learned submit request with one case's values
+    """
+    timer = PhaseTimer()
+
+    body = dict(template["body"])
+    for name, fill_value in fill_values.items():
+        if name in template["keys"]:
+            body[template["keys"][name]] = "" if fill_value is None else fill_value
+
+    with timer.phase("submit"):
+        options = {"form": body} if template["encoding"] == "form" else {"data": body}
+        response = await api.fetch(
+            template["url"],
+            method=template["method"],
+            headers=template["headers"],
+            max_redirects=0,
+            **options
+        )
+
+    with timer.phase("detect"):
+        status_code = response.status
+        location = response.headers.get("location")
+
+        if template["resource_type"] == "document" and 300 <= status_code < 400 and location:
+            # Classic form posts redirect back to the form when validation fails
+            back_to_form = urlparse(urljoin(template["url"], location)).path == urlparse(CONFIG["url"]).path
+            label = f"{template['method']} {urlparse(template['url']).path} {status_code} → {location}"
+            if back_to_form:
+                result, reason = False, f"Redirected Back To Form ({label})"
+            else:
+                result, reason = True, f"Redirected Away ({label})"
+        else:
+            try:
+                payload = await response.json()
+            except Exception:
+                payload = _MISSING
+            result, reason = classify_network_result(
+                template["method"], template["url"], template["resource_type"], status_code, payload
+            )
+        await response.dispose()
+
+    return {
+        "field": field_name,
+        "input": value,
+        "expected": expected,
+        "actual": result,
+        "status": "PASS" if result == expected else "FAIL",
+        "reason": reason,
+        "timings": timer.finish()
+    }
+
+
 # ===============================
 # MAIN TEST RUNNER
 # ===============================
 
+async def launch_browser(p, profile):
+    """
+    Launches Chromium with a launch profile's mode and switches.
+    Contexts are incognito, so the profile's disk cache directory does
+    not apply here; the asset cache is what shares assets across them.
+    """
+    options = {"headless": profile["headless"], "args": profile["args"]}
+    if profile["channel"]:
+        options["channel"] = profile["channel"]
+
+    return await p.chromium.launch(**options)
+
+
+async def create_worker_page(browser, index=0):
+    """
+    Creates an isolated context with the page-side helpers and routes installed
+    """
+    har = CONFIG["har"]
+    context_options = {}
+    if har["mode"] == "record":
+        context_options["record_har_path"] = har_path_for_worker(index)
+
+    profile = resolve_launch_profile(CONFIG["launch_profile"], CONFIG["headless"])
+    if profile["viewport"]:
+        context_options["viewport"] = profile["viewport"]
+    if profile["reduced_motion"]:
+        context_options["reduced_motion"] = "reduce"
+
+    context = await browser.new_context(**context_options)
+
+    if har["mode"] == "replay":
+        # Routes registered first are consulted last, so only the
+        # first HAR applies the configured not_found behaviour
+        for i, har_path in enumerate(recorded_har_paths()):
+            await context.route_from_har(
+                har_path,
+                not_found=har["not_found"] if i == 0 else "fallback"
+            )
+
+    if CONFIG["incremental_tracking"]:
+        await context.add_init_script(FORM_WATCH_SCRIPT)
+
+    if CONFIG["reset_strategy"] == "snapshot":
+        await context.route(CONFIG["url"], serve_cached_document)
+
+    # Handlers get this site's settings bound; they run outside the site task
+    if CONFIG["asset_cache"]["enabled"]:
+        await context.route("**/*", functools.partial(serve_cached_asset, cfg=CONFIG["asset_cache"]))
+
+    # Registered last so it is consulted first: blocked requests never reach the cache
+    if CONFIG["block"]["enabled"]:
+        await context.route("**/*", functools.partial(block_resources, cfg=CONFIG["block"]))
+
+    return await context.new_page()
+
+
+# Per-host limits shared by every site run on the same event loop
+HOST_SEMAPHORES = {}
+HOST_THROTTLES = {}
+
+
+def host_limits(url):
+    """
+    (semaphore, throttle) for the host of `url`, from CONFIG["max_per_host"]
+    and CONFIG["politeness_delay_ms"]; None where no limit is configured
+    """
+    key = (urlparse(url).hostname, id(asyncio.get_running_loop()))
+
+    if CONFIG["max_per_host"] and key not in HOST_SEMAPHORES:
+        HOST_SEMAPHORES[key] = asyncio.Semaphore(CONFIG["max_per_host"])
+
+    if CONFIG["politeness_delay_ms"] and key not in HOST_THROTTLES:
+        HOST_THROTTLES[key] = rate_limiter(1000 / CONFIG["politeness_delay_ms"])
+
+    return HOST_SEMAPHORES.get(key), HOST_THROTTLES.get(key)
+
+
 async def run():
     async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=False)
-        page = await browser.new_page()
+        profile = resolve_launch_profile(CONFIG["launch_profile"], CONFIG["headless"])
+        browser = await launch_browser(p, profile)
+
+        results = await run_site(browser)
+
+        await browser.close()
+
+        return results
+
+
+async def run_site(browser):
+    """
+    Runs every case of CONFIG's site in contexts of its own on `browser`,
+    which may be shared with other sites (see batch.py)
+    """
+    # 🔹 WORKER POOL: one isolated context + page per worker
+    workers = max(1, CONFIG["workers"])
+    pages = asyncio.Queue()
+    contexts = []
+    cache = None
+    window = deque()
+
+    try:
+        for index in range(workers):
+            page = await create_worker_page(browser, index)
+            contexts.append(page.context)
+            pages.put_nowait(page)
+
+        semaphore = asyncio.Semaphore(workers)
+        host_semaphore, host_throttle = host_limits(CONFIG["url"])
+        if host_semaphore is None:
+            host_semaphore = asyncio.Semaphore(workers)
+
+        async def run_on_worker(case):
+            async with semaphore, host_semaphore:
+                if host_throttle:
+                    await host_throttle()
+                page = await pages.get()
+                try:
+                    return await run_case(page, *case)
+                except Exception as e:
+                    field_name, value, expected, _ = case
+                    return {
+                        "field": field_name,
+                        "input": value,
+                        "expected": expected,
+                        "actual": None,
+                        "status": "ERROR",
+                        "reason": f"Error: {str(e)}"
+                    }
+                finally:
+                    pages.put_nowait(page)
+
+        # 🔹 PRE-VALIDATION / RESULT CACHE / HTTP FUZZ: the form is probed once up front
+        http_fuzz = CONFIG["http_fuzz"]["enabled"]
+        prevalidator = None
+        fingerprint = None
+        template = None
+
+        if CONFIG["prevalidation"]["enabled"] or CONFIG["result_cache"]["enabled"] or http_fuzz:
+            page = await pages.get()
+            try:
+                await load_form(page)
+                constraints = await extract_constraints(page)
+                signature = await get_form_signature(page)
+                if http_fuzz:
+                    template = await learn_submit_request(page)
+            finally:
+                pages.put_nowait(page)
+
+            # HTTP fuzzing predicts UI blocks only to flag them, never to skip a case
+            if CONFIG["prevalidation"]["enabled"] or http_fuzz:
+                prevalidator = PreValidator(
+                    constraints, CONFIG["prevalidation"]["confirm_rate"],
+                    typed=CONFIG["fill_mode"] == "type"
+                )
+
+            if CONFIG["result_cache"]["enabled"]:
+                cache_cfg = CONFIG["result_cache"]
+                cache = ResultCache(
+                    cache_cfg["path"], cache_cfg["ttl_hours"], cache_cfg["verify_rate"]
+                )
+                fingerprint = form_fingerprint(form_structure(signature, constraints))
+
+        async def run_or_predict(case):
+            field_name, value, expected, fill_values = case
+
+            # Cached verdicts come from the browser, so HTTP fuzzing does not use them
+            cached = cache.get(fingerprint, field_name, value, expected) if cache and not http_fuzz else None
+            if cached is not None:
+                actual, reason = cached
+                return {
+                    "field": field_name,
+                    "input": value,
+                    "expected": expected,
+                    "actual": actual,
+                    "status": "PASS" if actual == expected else "FAIL",
+                    "reason": f"Cached: {reason}",
+                    "cached": True,
+                    "timings": {}
+                }
+
+            prediction = prevalidator.predict(fill_values) if prevalidator else None
+
+            if http_fuzz:
+                await throttle()
+                async with http_semaphore:
+                    try:
+                        result = await run_http_case(api, template, *case)
+                    except Exception as e:
+                        return {
+                            "field": field_name,
+                            "input": value,
+                            "expected": expected,
+                            "actual": None,
+                            "status": "ERROR",
+                            "reason": f"Error: {str(e)}"
+                        }
+
+                if prediction:
+                    result["ui_blocked"] = prediction[1]
+                    if result["actual"] is True:
+                        result["reason"] += f" (SERVER ACCEPTS UI-BLOCKED INPUT: {prediction[0]} {prediction[1]})"
+                return result
+
+            if prediction and not prevalidator.should_confirm():
+                return {
+                    "field": field_name,
+                    "input": value,
+                    "expected": expected,
+                    "actual": False,
+                    "status": "PASS" if expected is False else "FAIL",
+                    "reason": f"Predicted Client-Side Block: {prediction[0]} ({prediction[1]})",
+                    "predicted": prediction[1],
+                    "timings": {}
+                }
+
+            result = await run_on_worker(case)
+
+            if cache and result["status"] != "ERROR":
+                cache.put(fingerprint, field_name, value, expected, result["actual"], result["reason"])
+
+            if prediction:
+                result["predicted"] = prediction[1]
+                result["prediction_confirmed"] = result["actual"] is False
+                if not result["prediction_confirmed"]:
+                    result["reason"] += f" (predicted {prediction[1]} on {prediction[0]} NOT confirmed)"
+
+            return result
+
+        if http_fuzz:
+            api = contexts[0].request  # shares the cookies of the learning context
+            http_semaphore = asyncio.Semaphore(CONFIG["http_fuzz"]["concurrency"])
+            throttle = rate_limiter(CONFIG["http_fuzz"]["rate_per_second"])
+            ahead = CONFIG["http_fuzz"]["concurrency"] * 2
+        else:
+            ahead = workers * 2
 
         # 🔹 LOG HEADER (ADDED)
         log("=" * 60)
         log("FORM VALIDATION TEST STARTED")
         log(f"URL: {CONFIG['url']}")
+        log(f"Workers: {workers}")
+        if http_fuzz:
+            log(f"HTTP fuzz: {template['method']} {template['url']} ({template['encoding']})")
+            log(f"   Field keys: {template['keys']}")
+            if template["csrf"]:
+                log(f"   CSRF tokens replayed as captured: {', '.join(template['csrf'])}")
         log(f"Timestamp: {datetime.now().isoformat()}")
         log("=" * 60)
 
-        for field_name, field in CONFIG["fields"].items():
-            if not field["enabled"]:
-                continue
+        # Cases are pulled lazily and only a small window is scheduled ahead
+        cases = build_cases()
 
-            log(f"\n🔹 Testing Field: {field_name}")
+        def schedule_next():
+            case = next(cases, None)
+            if case is not None:
+                window.append((case, asyncio.create_task(run_or_predict(case))))
 
-            for value, expected in TEST_DATA.get(field["type"], []):
-                await page.goto(CONFIG["url"], timeout=60000)
+        for _ in range(ahead):
+            schedule_next()
 
-                shared_values = {}
+        # Results are logged in original case order as they complete
+        results = []
+        current_field = None
+        while window:
+            (field_name, value, expected, _), task = window.popleft()
+            result = await task
+            schedule_next()
 
-                for name, f in CONFIG["fields"].items():
-                    if not f["enabled"]:
-                        continue
+            if field_name != current_field:
+                current_field = field_name
+                log(f"\n🔹 Testing Field: {field_name}")
 
-                    if f["type"] == "email" and value == "__UNIQUE_EMAIL__":
-                        fill_value = generate_unique_email()
+            log(f"   [{result['status']}] Input: {value} → {result['reason']}")
+            current_sink().record(result)
+            results.append(result)
 
-                    elif "depends_on" in f:
-                        fill_value = shared_values.get(f["depends_on"])
+        if http_fuzz:
+            bypasses = [r for r in results if r.get("ui_blocked") and r["actual"] is True]
+            log(f"\nServer accepted {len(bypasses)} input(s) the UI blocks")
+            for r in bypasses:
+                log(f"   {r['field']}: {r['input']!r} ({r['ui_blocked']})")
 
-                    elif name == field_name:
-                        fill_value = value
+        if cache:
+            log(f"\nResult cache: {cache.hits} hits, {cache.misses} misses (fingerprint {fingerprint[:12]})")
 
-                    else:
-                        fill_value = "Valid123"
-
-                    shared_values[name] = fill_value
-                    await fill_field(page, f, fill_value)
-
-                # CAPTURE FORM SIGNATURE BEFORE CLICKING SUBMIT
-                old_form_signature = await get_form_signature(page)
-                old_url = page.url
-                
-                await page.click(CONFIG["submit_selector"])
-                await page.wait_for_timeout(CONFIG["wait_after_submit"] * 1000)
-
-                # PASS THE OLD SIGNATURE FOR COMPARISON
-                result, reason = await detect_success(page, old_url, old_form_signature)
-                status = "PASS" if result == expected else "FAIL"
-
-                log(f"   [{status}] Input: {value} → {reason}")
+        log("\n" + "=" * 60)
+        log("TIMING SUMMARY (ms)")
+        log("=" * 60)
+        log(summarize_timings(results))
 
-                await asyncio.sleep(CONFIG["delay_between_tests"])
+        return results
+    finally:
+        # Runs on any exit, so a failing site leaves nothing running or open
+        # on a browser it may share with other sites
+        for _, task in window:
+            task.cancel()
+        if window:
+            await asyncio.gather(*(task for _, task in window), return_exceptions=True)
+        if cache:
+            cache.close()
 
-        await browser.close()
+        # Closing contexts explicitly flushes any HAR recordings
+        for context in contexts:
+            await context.close()
 
 
 # ===============================
 # START EXECUTION
 # ===============================
 
-asyncio.run(run())
+if __name__ == "__main__":
+    asyncio.run(run())
@@ -0,0 +1,23 @@
+# ===============================
+# SHARED PAGE-SIDE HELPERS
+# ===============================
+
+# Visibility and interactability checks used by the form snapshot
+# (online.py) and form discovery (discover.py). Pasted into the body of
+# a page function; `s` is the computed style and `rect` the bounding box.
+INTERACTABILITY_JS = """
+        const isShown = (s, rect) => (
+            s.display !== 'none' &&
+            s.visibility !== 'hidden' &&
+            s.opacity !== '0' &&
+            rect.width > 0 &&
+            rect.height > 0
+        );
+
+        const isInteractable = (el, s, rect) => (
+            isShown(s, rect) &&
+            !el.disabled &&
+            el.tabIndex !== -1 &&
+            !el.hasAttribute('aria-hidden')
+        );
+"""
@@ -0,0 +1,152 @@
+import random
+import re
+
+
+# ===============================
+# HTML5 CONSTRAINT EXTRACTION
+# ===============================
+
+# Reads the constraint validation attributes of one element.
+# Playwright: locator.evaluate(CONSTRAINTS_SCRIPT)
+# Selenium:   execute_script(f"return ({CONSTRAINTS_SCRIPT})(arguments[0])", element)
+CONSTRAINTS_SCRIPT = """
+    (el) => ({
+        tag: el.tagName,
+        type: (el.type || '').toLowerCase(),
+        required: !!el.required,
+        pattern: el.getAttribute('pattern'),
+        min: el.getAttribute('min'),
+        max: el.getAttribute('max'),
+        minlength: el.minLength > 0 ? el.minLength : null,
+        maxlength: el.maxLength > 0 ? el.maxLength : null,
+        barred: !!(el.disabled || el.readOnly || (el.form && el.form.noValidate))
+    })
+"""
+
+
+# ===============================
+# LOCAL CONSTRAINT EVALUATION
+# ===============================
+
+# WHATWG "valid e-mail address"
+EMAIL_RE = re.compile(
+    r"[a-zA-Z0-9.!#$%&'*+/=?^_`{|}~-]+@[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?"
+    r"(?:\.[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?)*"
+)
+FLOAT_RE = re.compile(r"-?(?:\d+(?:\.\d+)?|\.\d+)(?:[eE][-+]?\d+)?")
+DATE_RE = re.compile(r"\d{4,}-\d{2}-\d{2}")
+
+TEXT_LIKE_TYPES = ("text", "search", "url", "tel", "email", "password", "textarea")
+
+
+def parse_bound(ftype, raw):
+    """
+    A min/max attribute as the browser reads it, or None when it is absent
+    or unparsable (browsers ignore e.g. max="abc")
+    """
+    if raw in (None, ""):
+        return None
+    if ftype == "number":
+        return float(raw) if FLOAT_RE.fullmatch(raw) else None
+    if ftype == "date":
+        return raw if DATE_RE.fullmatch(raw) else None
+    return None
+
+
+def predict_block(value, constraints, typed=True):
+    """
+    Returns the ValidityState flag that would make the browser block
+    submitting `value` (e.g. "typeMismatch"), or None if it would submit.
+    `typed` means the value is entered with keystrokes (Selenium send_keys)
+    rather than assigned programmatically (Playwright fill on a number input
+    is rejected outright, so no badInput is predicted there; tooShort is
+    only flagged after a user edit). Text-like values are cut at maxlength
+    first, as every fill path does.
+    """
+    if not constraints or constraints.get("barred"):
+        return None
+
+    value = "" if value is None else str(value)
+    ftype = constraints.get("type") or "text"
+
+    maxlength = constraints.get("maxlength")
+    if maxlength and ftype in TEXT_LIKE_TYPES:
+        value = value[:maxlength]
+
+    if ftype == "email":
+        value = value.strip()
+
+    elif ftype == "number":
+        if value and not FLOAT_RE.fullmatch(value):
+            if typed:
+                return "badInput"
+            value = ""
+
+    elif ftype == "date":
+        if value and not DATE_RE.fullmatch(value):
+            if typed:
+                return None  # keystrokes land in the date widget unpredictably
+            value = ""
+
+    if value == "":
+        return "valueMissing" if constraints.get("required") else None
+
+    if ftype == "email" and not EMAIL_RE.fullmatch(value):
+        return "typeMismatch"
+
+    if ftype in TEXT_LIKE_TYPES:
+        pattern = constraints.get("pattern")
+        if pattern:
+            try:
+                if not re.fullmatch(f"(?:{pattern})", value):
+                    return "patternMismatch"
+            except re.error:
+                pass  # JS-only regex syntax; leave it to the browser
+
+        minlength = constraints.get("minlength")
+        if typed and minlength and len(value) < minlength:
+            return "tooShort"
+
+    if ftype in ("number", "date"):
+        current = float(value) if ftype == "number" else value
+        low = parse_bound(ftype, constraints.get("min"))
+        high = parse_bound(ftype, constraints.get("max"))
+        if low is not None and current < low:
+            return "rangeUnderflow"
+        if high is not None and current > high:
+            return "rangeOverflow"
+
+    return None
+
+
+# ===============================
+# PRE-VALIDATION ENGINE
+# ===============================
+
+class PreValidator:
+    """
+    Predicts which cases the browser would block client-side from the
+    constraints extracted once per form. A `confirm_rate` fraction of the
+    predicted cases is still sent to the browser to confirm the prediction.
+    """
+
+    def __init__(self, constraints, confirm_rate=0.0, typed=True, seed=0):
+        self.constraints = constraints
+        self.confirm_rate = confirm_rate
+        self.typed = typed
+        self._random = random.Random(seed)
+
+    def predict(self, values):
+        """
+        Returns (field_name, reason) for the first filled value the browser
+        would block, or None when the form would be submitted
+        """
+        for field_name, value in values.items():
+            reason = predict_block(value, self.constraints.get(field_name), self.typed)
+            if reason:
+                return field_name, reason
+        return None
+
+    def should_confirm(self):
+        """Whether to run a predicted case in the real browser anyway"""
+        return self._random.random() < self.confirm_rate
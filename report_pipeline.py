@@ -0,0 +1,416 @@
+import html
+import os
+import shutil
+from datetime import datetime
+from xml.sax.saxutils import escape, quoteattr
+
+from results_sink import ResultsSink
+from timing import TimingAggregate
+
+
+# ===============================
+# RUNNING AGGREGATES
+# ===============================
+
+def recommendations_for(vuln):
+    """Remediation advice for one accepted invalid input"""
+    field = vuln['field']
+    description = vuln['description']
+    recommendations = []
+
+    if field == 'name':
+        if 'Alphanumeric' in description:
+            recommendations.append("- NAME: Add validation to reject numeric characters")
+        if 'Special Characters' in description:
+            recommendations.append("- NAME: Add validation to reject special characters")
+        if 'Empty' in description:
+            recommendations.append("- NAME: Make field required (cannot be empty)")
+
+    elif field == 'age':
+        if 'Underage' in description:
+            recommendations.append("- AGE: Implement minimum age requirement (18+)")
+        if 'Invalid' in description or 'Negative' in description:
+            recommendations.append("- AGE: Add range validation (18-120)")
+        if 'Alphabetic' in description:
+            recommendations.append("- AGE: Restrict input to numeric values only")
+
+    elif field == 'email':
+        recommendations.append("- EMAIL: Implement proper email format validation (RFC 5322)")
+
+    elif field == 'password':
+        if 'Short' in description:
+            recommendations.append("- PASSWORD: Enforce minimum length (8+ characters)")
+        if 'Weak' in description:
+            recommendations.append("- PASSWORD: Require strong password (uppercase, lowercase, numbers, special chars)")
+
+    elif field == 'confirm_password':
+        recommendations.append("- CONFIRM PASSWORD: Ensure password fields match before submission")
+
+    elif field == 'phone':
+        if 'Alphanumeric' in description:
+            recommendations.append("- PHONE: Restrict to numeric values only")
+        if 'Short' in description or 'Long' in description:
+            recommendations.append("- PHONE: Enforce exact length (10 digits)")
+
+    elif field == 'dob':
+        if 'Future' in description:
+            recommendations.append("- DOB: Validate date is not in the future")
+        if 'Underage' in description:
+            recommendations.append("- DOB: Ensure user is at least 18 years old")
+        if 'Format' in description:
+            recommendations.append("- DOB: Use proper date picker (YYYY-MM-DD)")
+
+    elif field == 'otp':
+        if 'Short' in description or 'Long' in description:
+            recommendations.append("- OTP: Enforce exactly 6 digits")
+        if 'Alphabetic' in description or 'Alphanumeric' in description:
+            recommendations.append("- OTP: Accept only numeric values")
+
+    return recommendations
+
+
+class ReportAggregate:
+    """
+    Everything the summary sections need, updated one result at a time
+    so no per-case list has to be kept
+    """
+
+    def __init__(self):
+        self.total = 0
+        self.passed = 0
+        self.failed = 0
+        self.vulnerabilities = []
+        self.recommendations = {}  # insertion-ordered set
+        self.skipped_fields = []
+        self.timings = TimingAggregate()
+
+    def add(self, result):
+        self.total += 1
+        if result['passed']:
+            self.passed += 1
+        else:
+            self.failed += 1
+
+        if result['expected'] == 'INVALID' and result['actual'] == 'ACCEPTED':
+            vuln = {
+                'field': result['field'],
+                'input': result['input'],
+                'description': result['test']
+            }
+            self.vulnerabilities.append(vuln)
+            self.recommendations.update(dict.fromkeys(recommendations_for(vuln)))
+
+        self.timings.add(result['field'], result.get('timings'))
+
+    def percent(self, count):
+        return count / self.total * 100 if self.total else 0.0
+
+
+# ===============================
+# REPORT SINKS
+# Each sink writes every result as it arrives and the summary
+# sections on close, so an interrupted run leaves a usable file
+# ===============================
+
+class TextReportSink:
+    extension = 'txt'
+
+    def __init__(self, path, meta):
+        self.path = path
+        self.current_field = None
+        self.f = open(path, 'w', encoding='utf-8')
+
+        self.f.write("="*80 + "\n")
+        self.f.write("FORM VALIDATION TEST REPORT\n")
+        self.f.write("="*80 + "\n")
+        self.f.write(f"Website URL: {meta['url']}\n")
+        self.f.write(f"Test Date: {meta['date']}\n")
+
+        self.f.write("\nFields Tested:\n")
+        for field in meta['fields']:
+            self.f.write(f"  ✓ {field.upper()}\n")
+        self.f.write("="*80 + "\n\n")
+
+        self.f.write("DETAILED TEST RESULTS\n")
+        self.f.write("-"*80 + "\n")
+        self.f.flush()
+
+    def write(self, result):
+        if self.current_field != result['field']:
+            self.current_field = result['field']
+            self.f.write(f"\n{self.current_field.upper()} FIELD TESTS\n")
+            self.f.write("-"*80 + "\n")
+
+        self.f.write(f"\n{result['result']} | Test: {result['test']}\n")
+        self.f.write(f"   Input: {result['input'] if result['input'] else '[EMPTY]'}\n")
+        self.f.write(f"   Expected: {result['expected']} | Actual: {result['actual']}\n")
+        self.f.write(f"   Status: {result['status']}\n")
+        self.f.flush()
+
+    def close(self, aggregate):
+        f = self.f
+
+        # Summary
+        f.write("\n" + "="*80 + "\n")
+        f.write("SUMMARY\n")
+        f.write("="*80 + "\n")
+        f.write(f"Total Tests: {aggregate.total}\n")
+        f.write(f"Passed: {aggregate.passed} ({aggregate.percent(aggregate.passed):.2f}%)\n")
+        f.write(f"Failed: {aggregate.failed} ({aggregate.percent(aggregate.failed):.2f}%)\n")
+
+        if aggregate.skipped_fields:
+            f.write("\nFields Skipped:\n")
+            for field in aggregate.skipped_fields:
+                f.write(f"  ✗ {field.upper()}\n")
+        f.write("\n")
+
+        # Executive Summary
+        f.write("EXECUTIVE SUMMARY\n")
+        f.write("-"*80 + "\n")
+        if not aggregate.vulnerabilities:
+            f.write("✓ No critical vulnerabilities found. All validations working correctly.\n")
+        else:
+            f.write(f"✗ CRITICAL: {len(aggregate.vulnerabilities)} vulnerabilities found!\n")
+            f.write("  The form accepts invalid data for the following fields:\n")
+            for vuln in aggregate.vulnerabilities:
+                f.write(f"  - {vuln['field'].upper()}: {vuln['description']}\n")
+
+        # Vulnerabilities Section
+        f.write("\n" + "="*80 + "\n")
+        f.write("SECURITY VULNERABILITIES\n")
+        f.write("="*80 + "\n")
+        if aggregate.vulnerabilities:
+            for i, vuln in enumerate(aggregate.vulnerabilities, 1):
+                f.write(f"\nVulnerability #{i}:\n")
+                f.write(f"  Field: {vuln['field'].upper()}\n")
+                f.write(f"  Issue: {vuln['description']}\n")
+                f.write(f"  Invalid Input Accepted: {vuln['input']}\n")
+        else:
+            f.write("\n✓ No vulnerabilities detected.\n")
+
+        # Timing Summary
+        f.write("\n" + "="*80 + "\n")
+        f.write("TIMING SUMMARY (ms)\n")
+        f.write("="*80 + "\n")
+        f.write(aggregate.timings.summary() + "\n")
+
+        # Recommendations
+        f.write("\n" + "="*80 + "\n")
+        f.write("RECOMMENDATIONS\n")
+        f.write("="*80 + "\n")
+        if aggregate.recommendations:
+            for rec in aggregate.recommendations:
+                f.write(f"{rec}\n")
+        else:
+            f.write("✓ Form validation is working correctly. No improvements needed.\n")
+
+        f.write("\n" + "="*80 + "\n")
+        f.write("END OF REPORT\n")
+        f.write("="*80 + "\n")
+        f.close()
+
+
+class JsonLinesSink:
+    extension = 'jsonl'
+
+    def __init__(self, path, meta):
+        self.path = path
+        self.sink = ResultsSink(jsonl_path=path, echo=False)
+
+    def write(self, result):
+        self.sink.record(result)
+
+    def close(self, aggregate):
+        self.sink.close()
+
+
+class JUnitXmlSink:
+    """
+    One <testsuite>, one <testcase> per result (classname = field).
+    Test cases stream into `<path>.part`, since the suite's counts go on the
+    <testsuite> element ahead of them; close() writes the final file. After
+    a crash the .part file still holds every finished case.
+    """
+    extension = 'xml'
+
+    def __init__(self, path, meta):
+        self.path = path
+        self.meta = meta
+        self.part_path = f"{path}.part"
+        self.seconds = 0.0
+        self.f = open(self.part_path, 'w', encoding='utf-8')
+
+    def write(self, result):
+        seconds = (result.get('timings') or {}).get('total', 0.0) / 1000
+        self.seconds += seconds
+        self.f.write(
+            f'    <testcase classname={quoteattr(result["field"])} name={quoteattr(result["test"])}'
+            f' time="{seconds:.3f}">\n'
+        )
+        if not result['passed']:
+            self.f.write(f'      <failure message={quoteattr(result["status"])}>')
+            self.f.write(escape(f"Input: {result['input']!r}\nReason: {result.get('reason')}"))
+            self.f.write('</failure>\n')
+        self.f.write('    </testcase>\n')
+        self.f.flush()
+
+    def close(self, aggregate):
+        self.f.close()
+
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+            f.write(
+                f'<testsuites tests="{aggregate.total}" failures="{aggregate.failed}" errors="0"'
+                f' time="{self.seconds:.3f}">\n'
+            )
+            f.write(
+                f'  <testsuite name="form-validation" tests="{aggregate.total}" failures="{aggregate.failed}"'
+                f' errors="0" skipped="0" time="{self.seconds:.3f}"'
+                f' timestamp={quoteattr(self.meta["date"])} hostname={quoteattr(self.meta["url"])}>\n'
+            )
+            f.write('    <properties>\n')
+            for name, value in (
+                ('passed', aggregate.passed),
+                ('vulnerabilities', len(aggregate.vulnerabilities))
+            ):
+                f.write(f'      <property name="{name}" value="{value}"/>\n')
+            f.write('    </properties>\n')
+            with open(self.part_path, encoding='utf-8') as part:
+                shutil.copyfileobj(part, f)
+            f.write('  </testsuite>\n')
+            f.write('</testsuites>\n')
+
+        os.remove(self.part_path)
+
+
+class HtmlReportSink:
+    """Result rows stream into a table; browsers render a partial file as-is"""
+    extension = 'html'
+
+    def __init__(self, path, meta):
+        self.path = path
+        self.f = open(path, 'w', encoding='utf-8')
+        self.f.write(f"""<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>Form Validation Test Report</title>
+<style>
+    body {{ font-family: sans-serif; margin: 2em; }}
+    table {{ border-collapse: collapse; width: 100%; }}
+    th, td {{ border: 1px solid #ccc; padding: 4px 8px; text-align: left; }}
+    tr.fail {{ background: #fde2e2; }}
+    tr.pass {{ background: #e6f4ea; }}
+</style>
+</head>
+<body>
+<h1>Form Validation Test Report</h1>
+<p>Website URL: {html.escape(meta['url'])}<br>Test Date: {html.escape(meta['date'])}</p>
+<h2>Detailed Test Results</h2>
+<table>
+<tr><th>Result</th><th>Field</th><th>Test</th><th>Input</th><th>Expected</th><th>Actual</th><th>Status</th></tr>
+""")
+        self.f.flush()
+
+    def write(self, result):
+        cells = [
+            result['result'], result['field'], result['test'],
+            result['input'] if result['input'] else '[EMPTY]',
+            result['expected'], result['actual'], result['status']
+        ]
+        row_class = 'pass' if result['passed'] else 'fail'
+        self.f.write(
+            f'<tr class="{row_class}">' + "".join(f"<td>{html.escape(str(c))}</td>" for c in cells) + "</tr>\n"
+        )
+        self.f.flush()
+
+    def close(self, aggregate):
+        f = self.f
+        f.write("</table>\n")
+
+        f.write("<h2>Summary</h2>\n<ul>\n")
+        f.write(f"<li>Total Tests: {aggregate.total}</li>\n")
+        f.write(f"<li>Passed: {aggregate.passed} ({aggregate.percent(aggregate.passed):.2f}%)</li>\n")
+        f.write(f"<li>Failed: {aggregate.failed} ({aggregate.percent(aggregate.failed):.2f}%)</li>\n")
+        if aggregate.skipped_fields:
+            skipped = ", ".join(field.upper() for field in aggregate.skipped_fields)
+            f.write(f"<li>Fields Skipped: {html.escape(skipped)}</li>\n")
+        f.write("</ul>\n")
+
+        f.write("<h2>Security Vulnerabilities</h2>\n")
+        if aggregate.vulnerabilities:
+            f.write("<ol>\n")
+            for vuln in aggregate.vulnerabilities:
+                f.write(
+                    f"<li>{html.escape(vuln['field'].upper())}: {html.escape(vuln['description'])}"
+                    f" (accepted input: <code>{html.escape(str(vuln['input']))}</code>)</li>\n"
+                )
+            f.write("</ol>\n")
+        else:
+            f.write("<p>No vulnerabilities detected.</p>\n")
+
+        f.write("<h2>Timing Summary (ms)</h2>\n")
+        f.write(f"<pre>{html.escape(aggregate.timings.summary())}</pre>\n")
+
+        f.write("<h2>Recommendations</h2>\n")
+        if aggregate.recommendations:
+            f.write("<ul>\n")
+            for rec in aggregate.recommendations:
+                f.write(f"<li>{html.escape(rec.lstrip('- '))}</li>\n")
+            f.write("</ul>\n")
+        else:
+            f.write("<p>Form validation is working correctly. No improvements needed.</p>\n")
+
+        f.write("</body>\n</html>\n")
+        f.close()
+
+
+REPORT_SINKS = {
+    'text': TextReportSink,
+    'jsonl': JsonLinesSink,
+    'junit': JUnitXmlSink,
+    'html': HtmlReportSink
+}
+
+
+# ===============================
+# REPORT PIPELINE
+# ===============================
+
+class ReportPipeline:
+    """
+    Feeds each finished result to the running aggregate and every sink.
+    Sinks are opened up front and finalized once by close().
+    """
+
+    def __init__(self, formats, basename, url, fields):
+        self.aggregate = ReportAggregate()
+        self.closed = False
+
+        meta = {
+            'url': url,
+            'date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'fields': fields
+        }
+        self.sinks = []
+        for name in formats:
+            sink_class = REPORT_SINKS[name]
+            self.sinks.append(sink_class(f"{basename}.{sink_class.extension}", meta))
+
+    @property
+    def paths(self):
+        return [sink.path for sink in self.sinks]
+
+    def emit(self, result):
+        self.aggregate.add(result)
+        for sink in self.sinks:
+            sink.write(result)
+
+    def close(self):
+        """Write the summary sections and close every sink"""
+        if self.closed:
+            return
+        self.closed = True
+
+        for sink in self.sinks:
+            sink.close(self.aggregate)
@@ -0,0 +1,94 @@
+import hashlib
+import json
+import random
+import sqlite3
+import threading
+import time
+
+
+# ===============================
+# PERSISTENT RESULT CACHE
+# ===============================
+
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS results (
+        key TEXT PRIMARY KEY,
+        fingerprint TEXT NOT NULL,
+        field TEXT NOT NULL,
+        input TEXT NOT NULL,
+        expected TEXT NOT NULL,
+        verdict INTEGER,
+        reason TEXT,
+        updated_at REAL NOT NULL
+    )
+"""
+
+
+def form_fingerprint(structure):
+    """
+    Stable hash of a form's structure (inputs, constraints, buttons, URL).
+    Callers should leave out volatile content such as visible texts.
+    """
+    payload = json.dumps(structure, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """
+    SQLite cache of verdicts keyed by form fingerprint + field + input + expected.
+    Entries older than `ttl_hours` are ignored, and `verify_rate` of the hits
+    are reported as misses so a sample keeps being re-checked in the browser.
+    """
+
+    def __init__(self, path=".result_cache.sqlite", ttl_hours=24, verify_rate=0.1, seed=None):
+        self.ttl = ttl_hours * 3600
+        self.verify_rate = verify_rate
+        self.hits = 0
+        self.misses = 0
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(SCHEMA)
+        self._db.commit()
+
+    @staticmethod
+    def make_key(fingerprint, field, test_input, expected):
+        payload = json.dumps([fingerprint, field, test_input, expected], default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, fingerprint, field, test_input, expected):
+        """Return the cached (verdict, reason), or None on a miss, expiry or verification sample"""
+        key = self.make_key(fingerprint, field, test_input, expected)
+
+        with self._lock:
+            row = self._db.execute(
+                "SELECT verdict, reason, updated_at FROM results WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None or time.time() - row[2] > self.ttl or self._random.random() < self.verify_rate:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+
+        verdict = None if row[0] is None else bool(row[0])
+        return verdict, row[1]
+
+    def put(self, fingerprint, field, test_input, expected, verdict, reason):
+        """Store the latest verdict for a case"""
+        key = self.make_key(fingerprint, field, test_input, expected)
+
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key, fingerprint, field, str(test_input), str(expected),
+                    None if verdict is None else int(verdict), reason, time.time()
+                )
+            )
+            self._db.commit()
+
+    def close(self):
+        with self._lock:
+            self._db.close()
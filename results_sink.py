@@ -0,0 +1,85 @@
+import json
+import queue
+import threading
+
+
+# ===============================
+# BUFFERED RESULTS SINK
+# ===============================
+
+_STOP = object()
+
+
+class ResultsSink:
+    """
+    Shared results writer for both runners.
+    Keeps the human log and the JSON Lines file open for the whole run
+    and writes them in batches from a background thread, so callers
+    (the asyncio event loop or Selenium worker threads) never block on disk.
+    """
+
+    def __init__(self, log_path=None, jsonl_path=None, echo=True, batch_size=256):
+        self.echo = echo
+        self.batch_size = batch_size
+        self.closed = False
+
+        self._files = {}
+        if log_path:
+            self._files["log"] = open(log_path, "a", encoding="utf-8")
+        if jsonl_path:
+            self._files["jsonl"] = open(jsonl_path, "a", encoding="utf-8")
+
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._drain, name="results-sink", daemon=True)
+        self._thread.start()
+
+    def log(self, message):
+        """Print a human-readable line and append it to the log file"""
+        if self.echo:
+            print(message)
+        self._queue.put(("log", message + "\n"))
+
+    def record(self, result):
+        """Append one structured result as a JSON Lines record"""
+        self._queue.put(("jsonl", json.dumps(result, ensure_ascii=False, default=str) + "\n"))
+
+    def _drain(self):
+        while True:
+            batch = [self._queue.get()]
+
+            # Take everything already queued so one write covers the whole batch
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = False
+            chunks = {}
+            for item in batch:
+                if item is _STOP:
+                    stop = True
+                    continue
+                name, line = item
+                chunks.setdefault(name, []).append(line)
+
+            for name, lines in chunks.items():
+                f = self._files.get(name)
+                if f:
+                    f.write("".join(lines))
+                    f.flush()
+
+            if stop:
+                return
+
+    def close(self):
+        """Flush everything still queued and close the files"""
+        if self.closed:
+            return
+        self.closed = True
+
+        self._queue.put(_STOP)
+        self._thread.join()
+
+        for f in self._files.values():
+            f.close()
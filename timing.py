@@ -0,0 +1,91 @@
+import math
+import time
+from contextlib import contextmanager
+
+
+# ===============================
+# PER-PHASE TIMING
+# ===============================
+
+PHASES = ("navigate", "fill", "signature", "submit", "settle", "detect", "total")
+
+
+class PhaseTimer:
+    """
+    Records monotonic durations (in milliseconds) for the phases of one test case
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.timings = {}
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000
+            self.timings[name] = round(self.timings.get(name, 0.0) + elapsed, 2)
+
+    def finish(self):
+        """Stamp the total case duration and return all timings"""
+        self.timings["total"] = round((time.perf_counter() - self.started) * 1000, 2)
+        return self.timings
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers"""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+class TimingAggregate:
+    """
+    Running per-phase samples for all cases and per field, so a summary
+    can be produced without keeping every result around
+    """
+
+    def __init__(self):
+        self.groups = {"ALL": {}}
+
+    def add(self, field, timings):
+        for group in ("ALL", field):
+            phases = self.groups.setdefault(group, {})
+            for phase, ms in (timings or {}).items():
+                phases.setdefault(phase, []).append(ms)
+
+    def values(self, phase, group="ALL"):
+        return list(self.groups.get(group, {}).get(phase, []))
+
+    def summary(self):
+        """p50/p95/max table per phase, for all cases and per field"""
+        header = f"{'FIELD':<18}{'PHASE':<11}{'N':>5}{'P50 ms':>10}{'P95 ms':>10}{'MAX ms':>10}"
+        lines = [header, "-" * len(header)]
+
+        for group, phases in self.groups.items():
+            ordered = [p for p in PHASES if p in phases] + sorted(p for p in phases if p not in PHASES)
+            for phase in ordered:
+                values = phases[phase]
+                lines.append(
+                    f"{group:<18}{phase:<11}{len(values):>5}"
+                    f"{percentile(values, 50):>10.1f}"
+                    f"{percentile(values, 95):>10.1f}"
+                    f"{max(values):>10.1f}"
+                )
+
+        return "\n".join(lines)
+
+
+def summarize_timings(results):
+    """
+    Builds a p50/p95/max table per phase, for all cases and per field.
+    `results` are dicts carrying 'field' and 'timings'.
+    """
+    aggregate = TimingAggregate()
+    for result in results:
+        aggregate.add(result["field"], result.get("timings"))
+    return aggregate.summary()